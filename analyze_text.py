@@ -2,18 +2,21 @@
 """Simple CLI for analyzing text with PyCEFRizer."""
 
 import sys
-import json
 from pycefrizer import PyCEFRizer
+from pycefrizer._jsonio import dumps
 
 
 def main():
-    if len(sys.argv) > 1:
-        # Text provided as command line argument
+    if len(sys.argv) == 2:
+        # Text provided as a single quoted command line argument
+        text = sys.argv[1]
+    elif len(sys.argv) > 2:
+        # Text provided as separate command line arguments
         text = ' '.join(sys.argv[1:])
     else:
         # Read from stdin
         print("Enter text to analyze (press Ctrl+D when done):")
-        text = sys.stdin.read()
+        text = sys.stdin.buffer.read().decode('utf-8', errors='replace')
     
     # Create analyzer
     analyzer = PyCEFRizer()
@@ -24,7 +27,7 @@ def main():
         
         # Print results
         print("\nPyCEFRizer Analysis Result:")
-        print(json.dumps(result, indent=2))
+        print(dumps(result).decode('utf-8'))
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
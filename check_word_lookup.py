@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """Check word_lookup.json contents."""
 
-import json
+from collections import Counter
+from pathlib import Path
 
-# Load the word lookup
-with open('data/word_lookup.json', 'r') as f:
-    data = json.load(f)
+from pycefrizer._jsonio import loads
+
+# Load the word lookup (orjson parses the raw bytes directly when available)
+data = loads((Path(__file__).parent / 'pycefrizer' / 'data' / 'word_lookup.json').read_bytes())
 
 print(f"Total words in word_lookup.json: {len(data)}")
 print("\nFirst 10 entries:")
@@ -24,11 +26,8 @@ for word in common_words:
         print(f"  {word}: NOT FOUND")
 
 # Check CEFR level distribution
-level_counts = {}
-for word, info in data.items():
-    level = info.get('CEFR', 'Unknown')
-    level_counts[level] = level_counts.get(level, 0) + 1
+level_counts = Counter(info.get('CEFR', 'Unknown') for info in data.values())
 
 print("\nCEFR level distribution:")
-for level in sorted(level_counts.keys()):
+for level in sorted(level_counts):
     print(f"  {level}: {level_counts[level]} words")
\ No newline at end of file
@@ -3,7 +3,7 @@
 
 import json
 import logging
-from pycefrizer import PyCEFRizer, setup_logger, get_word_level
+from pycefrizer import PyCEFRizer, setup_logger
 
 
 def main():
@@ -130,16 +130,16 @@ def main():
     
     print("\nWord CEFR Levels:")
     for word in test_words:
-        level = get_word_level(word)
+        level = analyzer.get_word_cefr_level(word)
         if level:
             print(f"  {word:<20} -> {level}")
         else:
             print(f"  {word:<20} -> (not found)")
     
     # Demonstrate single word analysis through main analyze method
-    print("\nSingle word analysis through analyze():")
-    for word in ["beautiful", "paradigm", "xyz123"]:
-        result = analyzer.analyze(word)
+    print("\nSingle word analysis through analyze_words():")
+    words = ["beautiful", "paradigm", "xyz123"]
+    for word, result in zip(words, analyzer.analyze_words(words)):
         level = result.get("CEFR_Level", "")
         print(f"  {word}: {level if level else '(not found)'}")
     
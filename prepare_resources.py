@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Normalize the bundled resource files.
+
+Rewrites pycefrizer/data/coca_frequencies.json with lowercase keys, so the
+loader can use the parsed dictionary as is. Keys that become equal when
+lowercased keep their best (lowest) rank; a key repeated in the file keeps
+its last value, as when the JSON is parsed.
+"""
+
+from pathlib import Path
+
+from pycefrizer._jsonio import dumps, loads
+
+COCA_PATH = Path(__file__).parent / 'pycefrizer' / 'data' / 'coca_frequencies.json'
+
+
+def normalize_frequencies(frequencies):
+    """Lowercase the words of a word -> rank mapping.
+
+    Args:
+        frequencies: Dictionary mapping words to their frequency ranks
+
+    Returns:
+        Dictionary with lowercase words, in the original order
+    """
+    normalized = {}
+    for word, rank in frequencies.items():
+        word = word.lower()
+        normalized[word] = min(rank, normalized.get(word, rank))
+    return normalized
+
+
+def main():
+    frequencies = loads(COCA_PATH.read_bytes())
+    normalized = normalize_frequencies(frequencies)
+    COCA_PATH.write_bytes(dumps(normalized))
+
+    renamed = sum(1 for word in frequencies if word != word.lower())
+    print(f"Wrote {len(normalized)} frequency ranks to {COCA_PATH} ({renamed} keys lowercased)")
+
+
+if __name__ == '__main__':
+    main()
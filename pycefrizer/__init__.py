@@ -2,12 +2,16 @@
 
 A Python implementation for estimating the CEFR-J level of English reading passages.
 Based on the CVLA3 methodology from Uchida & Negishi (2025).
+
+The analyzer classes and word lookup helpers are imported on first access
+(PEP 562), so importing the package does not load spaCy until it is needed.
 """
 
-from .pycefrizer import PyCEFRizer
-from .metrics import MetricsCalculator
-from .resources import ResourceManager
-from .cefr_mapping import CEFRMapper
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Lightweight modules are imported eagerly. config and logger must be bound
+# here because their names shadow the submodules they are defined in.
 from .config import config
 from .exceptions import (
     PyCEFRizerError,
@@ -17,10 +21,13 @@ from .exceptions import (
     MetricCalculationError
 )
 from .logger import logger, setup_logger
-from .word_lookup import get_word_level, check_word_level
-from .metrics import MetricsCalculator
-from .resources import ResourceManager
-from .cefr_mapping import CEFRMapper
+
+if TYPE_CHECKING:
+    from .cefr_mapping import CEFRMapper
+    from .metrics import MetricsCalculator
+    from .pycefrizer import PyCEFRizer
+    from .resources import ResourceManager
+    from .word_lookup import check_word_level, get_word_level
 
 __version__ = "3.0.0"
 __all__ = [
@@ -45,8 +52,40 @@ __all__ = [
     "check_word_level",
 ]
 
+# Maps each lazily imported public name to the submodule defining it
+_LAZY_IMPORTS = {
+    "PyCEFRizer": ".pycefrizer",
+    "MetricsCalculator": ".metrics",
+    "ResourceManager": ".resources",
+    "CEFRMapper": ".cefr_mapping",
+    "get_word_level": ".word_lookup",
+    "check_word_level": ".word_lookup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # Convenience function
-def analyze(text):
-    """Convenience function to analyze text."""
-    analyzer = PyCEFRizer()
-    return analyzer.analyze(text)
\ No newline at end of file
+def analyze(text: str) -> Dict[str, str]:
+    """Convenience function to analyze text.
+
+    Uses the same shared analyzer as get_word_level, which is created on the
+    first call, so the spaCy model and resources are only loaded once per
+    process.
+    """
+    from .word_lookup import _get_analyzer
+    return _get_analyzer().analyze(text)
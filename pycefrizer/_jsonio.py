@@ -0,0 +1,78 @@
+"""JSON serialization helpers for PyCEFRizer."""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# JSON files at least this large are memory-mapped instead of read into a
+# bytes object when orjson is available
+MMAP_THRESHOLD = 50_000_000
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard
+    library json module otherwise.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent the output with two spaces
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or text.
+
+    Uses orjson when it is installed and falls back to the standard
+    library json module otherwise. Both raise json.JSONDecodeError
+    on malformed input.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Deserialize a JSON file.
+
+    Large files are memory-mapped and parsed by orjson straight from the
+    mapping, which avoids holding a second full copy of the file in memory
+    while it is parsed.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is None or path.stat().st_size < MMAP_THRESHOLD:
+        return loads(path.read_bytes())
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
@@ -1,10 +1,49 @@
 """CEFR level mapping functions for PyCEFRizer."""
 
+import logging
+from bisect import bisect_right
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from .config import config
 from .logger import logger
 
+# The config mappings are read-only, so they can be bound once at import
+_COEFFICIENTS = config.REGRESSION_COEFFICIENTS
+
+# Regression coefficients laid out as arrays for vectorized scoring
+_METRIC_NAMES = tuple(_COEFFICIENTS)
+_METRIC_INDEX = {name: i for i, name in enumerate(_METRIC_NAMES)}
+_SLOPES = np.array([slope for slope, _ in _COEFFICIENTS.values()])
+_INTERCEPTS = np.array([intercept for _, intercept in _COEFFICIENTS.values()])
+_CEFR_KEYS = tuple(f"{name}_CEFR" for name in _METRIC_NAMES)
+
+# CEFR-J boundaries split into parallel tuples for bisection
+_BOUNDARY_CUTS = tuple(boundary for boundary, _ in config.CEFR_J_BOUNDARIES)
+_BOUNDARY_LABELS = tuple(level for _, level in config.CEFR_J_BOUNDARIES)
+
+
+def _middle_mean(scores: List[float]) -> float:
+    """Average the scores excluding the minimum and maximum.
+    
+    Summing the sorted middle values with Python's sum() keeps results
+    stable at level boundaries; (total - min - max) and NumPy's pairwise
+    summation do not, so the scalar and batch paths both use this.
+    
+    Args:
+        scores: At least three CEFR scores
+        
+    Returns:
+        Mean of the middle scores
+    """
+    return sum(sorted(scores)[1:-1]) / (len(scores) - 2)
+
+
+def _scalar_regression(metric_value: float, slope: float, intercept: float) -> float:
+    """Apply a single regression equation, capped at the maximum CEFR score."""
+    return min(metric_value * slope + intercept, config.MAX_CEFR_SCORE)
+
 
 class CEFRMapper:
     """Maps metric scores to CEFR-J levels using regression equations."""
@@ -26,16 +65,12 @@ class CEFRMapper:
         Raises:
             ValueError: If metric name is unknown
         """
-        if metric_name not in config.REGRESSION_COEFFICIENTS:
+        coefficients = _COEFFICIENTS.get(metric_name)
+        if coefficients is None:
             raise ValueError(f"Unknown metric: {metric_name}")
         
-        slope, intercept = config.REGRESSION_COEFFICIENTS[metric_name]
-        cefr_score = metric_value * slope + intercept
-        
-        # Cap at maximum score
-        cefr_score = min(cefr_score, config.MAX_CEFR_SCORE)
-        
-        logger.debug(f"{metric_name}: {metric_value:.4f} -> CEFR {cefr_score:.4f}")
+        cefr_score = _scalar_regression(metric_value, *coefficients)
+        logger.debug("%s: %.4f -> CEFR %.4f", metric_name, metric_value, cefr_score)
         return cefr_score
     
     def calculate_cefr_scores(self, metrics: Dict[str, float]) -> Dict[str, float]:
@@ -46,18 +81,36 @@ class CEFRMapper:
             
         Returns:
             Dictionary of metric names to CEFR scores
+            
+        Raises:
+            ValueError: If a metric name is unknown
         """
-        cefr_scores = {}
-        
-        for metric_name, metric_value in metrics.items():
-            try:
-                cefr_score = self.apply_regression(metric_value, metric_name)
-                cefr_scores[f"{metric_name}_CEFR"] = round(cefr_score, 2)
-            except ValueError as e:
-                logger.error(f"Error processing metric {metric_name}: {e}")
-                raise
-                
-        return cefr_scores
+        # All metrics are scored in one vectorized step rather than through
+        # per-metric apply_regression() calls
+        names = list(metrics)
+        
+        try:
+            indices = [_METRIC_INDEX[name] for name in names]
+        except KeyError as e:
+            metric_name = e.args[0]
+            logger.error("Error processing metric %s: Unknown metric: %s", metric_name, metric_name)
+            raise ValueError(f"Unknown metric: {metric_name}") from None
+        
+        values = np.fromiter(metrics.values(), dtype=np.float64, count=len(names))
+        scores = np.minimum(
+            values * _SLOPES[indices] + _INTERCEPTS[indices],
+            config.MAX_CEFR_SCORE
+        ).tolist()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for metric_name, metric_value, cefr_score in zip(names, values.tolist(), scores):
+                logger.debug("%s: %.4f -> CEFR %.4f", metric_name, metric_value, cefr_score)
+        
+        # Python's round() keeps the output identical to the scalar path
+        return dict(zip(
+            [_CEFR_KEYS[i] for i in indices],
+            [round(cefr_score, 2) for cefr_score in scores]
+        ))
     
     def calculate_final_level(self, cefr_scores: Dict[str, float]) -> float:
         """Calculate final CEFR level by averaging middle 6 values.
@@ -70,30 +123,22 @@ class CEFRMapper:
         Returns:
             Final averaged CEFR score
         """
-        # Extract just the scores
-        scores = list(cefr_scores.values())
+        # Extract and sort the scores in one step
+        scores = sorted(cefr_scores.values())
+        num_scores = len(scores)
         
-        if len(scores) <= 2:
+        if num_scores <= 2:
             # If we have 2 or fewer scores, just average them all
-            final_score = sum(scores) / len(scores) if scores else 0.0
-            logger.warning(f"Only {len(scores)} scores available, averaging all")
+            final_score = sum(scores) / num_scores if scores else 0.0
+            logger.warning("Only %d scores available, averaging all", num_scores)
             return final_score
         
-        # Sort scores
-        scores.sort()
-        
         # Log min and max that will be excluded
-        logger.debug(f"Excluding min ({scores[0]:.2f}) and max ({scores[-1]:.2f})")
+        logger.debug("Excluding min (%.2f) and max (%.2f)", scores[0], scores[-1])
         
-        # Remove minimum and maximum
-        middle_scores = scores[1:-1]
-        
-        if not middle_scores:
-            return 0.0
-            
-        # Calculate average of middle values
-        final_score = sum(middle_scores) / len(middle_scores)
-        logger.info(f"Final CEFR score: {final_score:.4f}")
+        # Average the middle values
+        final_score = _middle_mean(scores)
+        logger.info("Final CEFR score: %.4f", final_score)
         
         return final_score
     
@@ -106,13 +151,15 @@ class CEFRMapper:
         Returns:
             CEFR-J level string
         """
-        for boundary, level in config.CEFR_J_BOUNDARIES:
-            if score < boundary:
-                logger.info(f"Score {score:.4f} maps to CEFR-J level: {level}")
-                return level
+        # A score equal to a boundary belongs to the level above it
+        index = bisect_right(_BOUNDARY_CUTS, score)
+        if index < len(_BOUNDARY_LABELS):
+            level = _BOUNDARY_LABELS[index]
+            logger.info("Score %.4f maps to CEFR-J level: %s", score, level)
+            return level
                 
-        # This should not happen due to the inf boundary, but just in case
-        logger.warning(f"Score {score:.4f} exceeds all boundaries, defaulting to C2")
+        # Only reachable for NaN scores because of the inf boundary
+        logger.warning("Score %.4f exceeds all boundaries, defaulting to C2", score)
         return 'C2'
     
     def process_metrics(self, metrics: Dict[str, float]) -> Tuple[str, Dict[str, str]]:
@@ -130,8 +177,9 @@ class CEFRMapper:
         cefr_scores = self.calculate_cefr_scores(metrics)
         
         # Log individual CEFR scores
-        for metric, score in cefr_scores.items():
-            logger.debug(f"{metric}: {score}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for metric, score in cefr_scores.items():
+                logger.debug("%s: %s", metric, score)
         
         # Calculate final level
         final_score = self.calculate_final_level(cefr_scores)
@@ -142,4 +190,64 @@ class CEFRMapper:
             metric: str(score) for metric, score in cefr_scores.items()
         }
         
-        return cefr_j_level, formatted_scores
\ No newline at end of file
+        return cefr_j_level, formatted_scores
+    
+    def process_metrics_batch(
+        self,
+        metrics_list: List[Dict[str, float]]
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """Process the metrics of several texts at once.
+        
+        Equivalent to calling process_metrics() on each entry, but the
+        regression runs as one array operation over an (N, metrics) matrix.
+        All entries must have the same metric names in the same order, as
+        calculate_all_metrics() returns them.
+        
+        Args:
+            metrics_list: Dictionaries of raw metric values
+            
+        Returns:
+            List of (CEFR-J level, dict of formatted CEFR scores) tuples
+            
+        Raises:
+            ValueError: If a metric name is unknown or the entries differ
+        """
+        if not metrics_list:
+            return []
+        
+        names = list(metrics_list[0])
+        if len(names) <= 2:
+            return [self.process_metrics(metrics) for metrics in metrics_list]
+        
+        try:
+            indices = [_METRIC_INDEX[name] for name in names]
+        except KeyError as e:
+            raise ValueError(f"Unknown metric: {e.args[0]}") from None
+        if any(list(metrics) != names for metrics in metrics_list):
+            raise ValueError("All metric dictionaries must have the same metrics")
+        
+        logger.info("Processing metrics of %d texts for CEFR-J level estimation", len(metrics_list))
+        
+        values = np.array([list(metrics.values()) for metrics in metrics_list], dtype=np.float64)
+        scores = np.minimum(
+            values * _SLOPES[indices] + _INTERCEPTS[indices],
+            config.MAX_CEFR_SCORE
+        )
+        
+        # Python's round() keeps the scores identical to the scalar path
+        rounded = [[round(score, 2) for score in row] for row in scores.tolist()]
+        
+        # Average the middle values (excluding min and max) of each row and
+        # map the results to CEFR-J levels exactly as the scalar path does;
+        # as in map_to_cefr_j(), NaN scores fall past the last boundary and
+        # default to C2
+        level_indices = [bisect_right(_BOUNDARY_CUTS, _middle_mean(row)) for row in rounded]
+        
+        cefr_keys = [_CEFR_KEYS[i] for i in indices]
+        return [
+            (
+                _BOUNDARY_LABELS[index] if index < len(_BOUNDARY_LABELS) else 'C2',
+                {key: str(score) for key, score in zip(cefr_keys, row)}
+            )
+            for index, row in zip(level_indices, rounded)
+        ]
@@ -2,14 +2,69 @@
 """Command-line interface for PyCEFRizer."""
 
 import sys
-import json
 import argparse
 from pathlib import Path
-from .pycefrizer import PyCEFRizer
+from typing import BinaryIO
+from . import _jsonio
+from .config import config
+from .exceptions import TextLengthError
+from .resources import ResourceManager
 
 
-def main():
-    """Main CLI entry point."""
+def _read_input(stream: BinaryIO, errors: str = 'strict') -> str:
+    """Read and decode raw input, rejecting oversized input while reading.
+    
+    At most config.MAX_INPUT_BYTES + 1 bytes are read, so oversized input
+    is never loaded into memory in full.
+    
+    Args:
+        stream: Binary stream of UTF-8 encoded input
+        errors: Error handling scheme passed to bytes.decode
+        
+    Returns:
+        Decoded text
+        
+    Raises:
+        TextLengthError: If the input exceeds config.MAX_INPUT_BYTES
+    """
+    data = stream.read(config.MAX_INPUT_BYTES + 1)
+    if len(data) > config.MAX_INPUT_BYTES:
+        raise TextLengthError(
+            f"Input is too large. Maximum {config.MAX_INPUT_BYTES} bytes allowed."
+        )
+    return data.decode('utf-8', errors=errors)
+
+
+def _read_file(path: Path) -> str:
+    """Read and decode an input file, rejecting oversized files before reading.
+    
+    Args:
+        path: Path of the UTF-8 encoded input file
+        
+    Returns:
+        Decoded text
+        
+    Raises:
+        TextLengthError: If the file exceeds config.MAX_INPUT_BYTES
+    """
+    size = path.stat().st_size
+    if size > config.MAX_INPUT_BYTES:
+        raise TextLengthError(
+            f"Input is too large. Maximum {config.MAX_INPUT_BYTES} bytes allowed, "
+            f"but got {size} bytes."
+        )
+    # The size of special files (e.g. pipes) is not known in advance, so the
+    # read is bounded as well
+    with open(path, 'rb') as f:
+        return _read_input(f)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the CLI.
+    
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="PyCEFRizer - CEFR-J Level Estimator for English text",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -58,59 +113,76 @@ Examples:
         help="Word mode: look up CEFR level for a single word"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import so repeated main() calls in one process reuse it
+_PARSER = _build_parser()
+
+
+def main():
+    """Main CLI entry point."""
+    args = _PARSER.parse_args()
     
     # Determine input text
     if args.file:
         try:
-            with open(args.file, 'r', encoding='utf-8') as f:
-                text = f.read()
+            text = _read_file(Path(args.file))
+        except TextLengthError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
         except Exception as e:
             print(f"Error reading file: {e}", file=sys.stderr)
             sys.exit(1)
     elif args.text:
         text = args.text
     else:
-        # Read from stdin
-        text = sys.stdin.read()
+        # Read from stdin as raw bytes to skip line-by-line text decoding
+        try:
+            text = _read_input(sys.stdin.buffer, errors='replace')
+        except TextLengthError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
     
     if not text.strip():
         print("Error: No text provided", file=sys.stderr)
         sys.exit(1)
     
-    # Create analyzer
-    analyzer = PyCEFRizer()
-    
     try:
         # Analyze text
         if args.word:
-            # Word mode - just return the CEFR level
-            level = analyzer.get_word_cefr_level(text.strip())
-            if level:
-                output = level
-            else:
-                output = ""
+            # Word mode - only the dictionary is needed, so skip loading spaCy
+            word = text.strip().lower()
+            level = None
+            if word and ' ' not in word:
+                level = ResourceManager().get_word_level(word)
+            output = (level or "").encode('utf-8')
         else:
-            # Full text analysis
+            # Full text analysis (spaCy is only imported in this branch)
+            from .pycefrizer import PyCEFRizer
+            analyzer = PyCEFRizer()
             if args.detailed:
                 result = analyzer.get_detailed_analysis(text)
             else:
                 result = analyzer.analyze(text)
             
             # Format output
-            output = json.dumps(result, indent=2)
+            output = _jsonio.dumps(result)
         
         # Write output
         if args.output:
             try:
-                with open(args.output, 'w', encoding='utf-8') as f:
+                # A 1 MiB buffer keeps large detailed outputs to a few syscalls
+                with open(args.output, 'wb', buffering=1 << 20) as f:
                     f.write(output)
                 print(f"Analysis saved to: {args.output}")
             except Exception as e:
                 print(f"Error writing output file: {e}", file=sys.stderr)
                 sys.exit(1)
         else:
-            print(output)
+            # Output is already UTF-8 bytes, so bypass the text layer
+            sys.stdout.buffer.write(output + b'\n')
+            sys.stdout.buffer.flush()
             
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1,7 +1,38 @@
 """Configuration settings for PyCEFRizer."""
 
-from dataclasses import dataclass
-from typing import Set, Dict, Tuple, List
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Set, Tuple
+
+from .logger import logger
+
+# Environment variable overriding Config.SPACY_BATCH_SIZE
+SPACY_BATCH_SIZE_ENV = 'PYCEFRIZER_SPACY_BATCH_SIZE'
+DEFAULT_SPACY_BATCH_SIZE = 64
+
+
+def _env_batch_size() -> int:
+    """Read the spaCy batch size from the environment.
+    
+    Returns:
+        The positive integer in PYCEFRIZER_SPACY_BATCH_SIZE, or the default
+        of 64 if it is unset or invalid (an invalid value is logged)
+    """
+    value = os.environ.get(SPACY_BATCH_SIZE_ENV)
+    if value is None:
+        return DEFAULT_SPACY_BATCH_SIZE
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        logger.warning(
+            "Ignoring invalid %s=%r; using %d",
+            SPACY_BATCH_SIZE_ENV, value, DEFAULT_SPACY_BATCH_SIZE
+        )
+        return DEFAULT_SPACY_BATCH_SIZE
+    return batch_size
 
 
 @dataclass(frozen=True)
@@ -11,9 +42,16 @@ class Config:
     # Text length constraints
     MIN_WORDS: int = 10
     MAX_WORDS: int = 10000
+    MAX_INPUT_BYTES: int = 1_000_000  # Raw input size rejected before decoding
     
     # spaCy model
     SPACY_MODEL: str = 'en_core_web_sm'
+    # Pipeline components not loaded; the metrics need the tagger, lemmatizer
+    # and parser (sentence boundaries and noun chunks), but not entities
+    SPACY_EXCLUDE: Tuple[str, ...] = ('ner',)
+    DOC_CACHE_SIZE: int = 32  # Processed texts kept per analyzer
+    # Texts per nlp.pipe batch in analyze_batch (env: PYCEFRIZER_SPACY_BATCH_SIZE)
+    SPACY_BATCH_SIZE: int = field(default_factory=_env_batch_size)
     
     # Content word POS tags
     CONTENT_POS_TAGS: Set[str] = frozenset({'NOUN', 'VERB', 'ADJ', 'ADV'})
@@ -21,22 +59,19 @@ class Config:
     # Verb-related settings
     BE_VERBS: Set[str] = frozenset({'be', 'am', 'is', 'are', 'was', 'were', 'been', 'being'})
     
-    @property
-    def CEFR_LEVELS(self) -> Dict[str, int]:
-        """CEFR level mappings."""
-        return {
-            'A1': 1,
-            'A2': 2,
-            'B1': 3,
-            'B2': 4,
-            'C1': 5,
-            'C2': 6
-        }
+    # CEFR level mappings
+    CEFR_LEVELS: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({
+        'A1': 1,
+        'A2': 2,
+        'B1': 3,
+        'B2': 4,
+        'C1': 5,
+        'C2': 6
+    }))
     
-    @property
-    def REGRESSION_COEFFICIENTS(self) -> Dict[str, Tuple[float, float]]:
-        """Regression equations coefficients (slope, intercept)."""
-        return {
+    # Regression equations coefficients (slope, intercept)
+    REGRESSION_COEFFICIENTS: Mapping[str, Tuple[float, float]] = field(
+        default_factory=lambda: MappingProxyType({
             'CVV1': (1.1059, -1.208),
             'BperA': (13.146, 0.428),
             'POStypes': (1.768, -12.006),
@@ -45,25 +80,24 @@ class Config:
             'AvrFreqRank': (0.004, -0.608),
             'VperSent': (2.203, -2.486),
             'LenNP': (2.629, -6.697)
-        }
+        })
+    )
     
-    @property
-    def CEFR_J_BOUNDARIES(self) -> List[Tuple[float, str]]:
-        """CEFR-J level boundaries."""
-        return [
-            (0.5, 'preA1'),
-            (0.84, 'A1.1'),
-            (1.17, 'A1.2'),
-            (1.5, 'A1.3'),
-            (2.0, 'A2.1'),
-            (2.5, 'A2.2'),
-            (3.0, 'B1.1'),
-            (3.5, 'B1.2'),
-            (4.0, 'B2.1'),
-            (4.5, 'B2.2'),
-            (5.5, 'C1'),
-            (float('inf'), 'C2')
-        ]
+    # CEFR-J level boundaries (upper bound, level)
+    CEFR_J_BOUNDARIES: Tuple[Tuple[float, str], ...] = (
+        (0.5, 'preA1'),
+        (0.84, 'A1.1'),
+        (1.17, 'A1.2'),
+        (1.5, 'A1.3'),
+        (2.0, 'A2.1'),
+        (2.5, 'A2.2'),
+        (3.0, 'B1.1'),
+        (3.5, 'B1.2'),
+        (4.0, 'B2.1'),
+        (4.5, 'B2.2'),
+        (5.5, 'C1'),
+        (float('inf'), 'C2')
+    )
     
     # Metric calculation settings
     MAX_CEFR_SCORE: float = 7.0
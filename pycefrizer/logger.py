@@ -2,7 +2,10 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# (level, format) last applied by setup_logger, keyed by logger name
+_applied_configs: Dict[str, Tuple[int, str]] = {}
 
 
 def setup_logger(
@@ -21,6 +24,18 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    
+    if format_string is None:
+        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    
+    # Skip rebuilding the handler if nothing has changed since the last call
+    if (
+        logger.handlers
+        and logger.level == level
+        and _applied_configs.get(name) == (level, format_string)
+    ):
+        return logger
+    
     logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
@@ -32,14 +47,12 @@ def setup_logger(
     handler.setLevel(level)
     
     # Set format
-    if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
     formatter = logging.Formatter(format_string)
     handler.setFormatter(formatter)
     
     logger.addHandler(handler)
     logger.propagate = False
+    _applied_configs[name] = (level, format_string)
     
     return logger
 
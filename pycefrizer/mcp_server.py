@@ -5,17 +5,22 @@ Provides MCP tools for analyzing English text difficulty levels
 """
 
 import asyncio
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
+import numpy as np
+from spacy.attrs import IS_ALPHA, IS_STOP, LOWER
+from spacy.strings import get_string_id
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from pycefrizer import PyCEFRizer
+from pycefrizer import PyCEFRizer, _jsonio, config
 from pycefrizer.exceptions import PyCEFRizerError
 
 # Configure logging
@@ -29,133 +34,340 @@ server = Server("pycefrizer")
 analyzer = PyCEFRizer()
 
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available tools"""
-    return [
-        Tool(
-            name="analyze_text",
-            description="Analyze English text and return CEFR-J level assessment with metric scores",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "English text to analyze (10-10,000 words)"
-                    }
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize a tool response as JSON (orjson when installed).
+    
+    Responses are compact unless pretty is set, since MCP clients are
+    programs rather than people.
+    """
+    return _jsonio.dumps(obj, pretty=pretty).decode('utf-8')
+
+
+# Memoized single-word lookups for the get_word_cefr_level tool
+_cefr_cache = lru_cache(maxsize=1 << 16)(analyzer.get_word_cefr_level)
+
+
+# Serialized results of the pure text -> result tools, keyed by the text
+# itself. Failed analyses raise and are therefore not cached.
+@lru_cache(maxsize=256)
+def _cached_analysis(text: str, pretty: bool = False) -> str:
+    """Analyze a text and return the serialized result."""
+    return _dumps(analyzer.analyze(text), pretty)
+
+
+@lru_cache(maxsize=256)
+def _cached_detailed_analysis(text: str, pretty: bool = False) -> str:
+    """Run a detailed analysis of a text and return the serialized result."""
+    return _dumps(analyzer.get_detailed_analysis(text), pretty)
+
+
+@lru_cache(maxsize=256)
+def _count_levels(text: str) -> Tuple[int, ...]:
+    """Count the content words of a text by CEFR level code.
+    
+    Args:
+        text: English text to analyze
+        
+    Returns:
+        Word counts indexed by level code (0 = not in dictionary)
+    """
+    # is_alpha and is_stop are lexical attributes, so tokenizing is enough
+    doc = analyzer.nlp.tokenizer(text)
+    
+    # Read the attributes of all tokens at once instead of creating Tokens
+    attrs = doc.to_array([IS_ALPHA, IS_STOP, LOWER])
+    lowers = attrs[(attrs[:, 0] == 1) & (attrs[:, 1] == 0), 2]
+    
+    known = HASH_LEVEL_CODES['hash']
+    codes = np.zeros(len(lowers), dtype=np.intp)
+    if len(known):
+        positions = np.minimum(np.searchsorted(known, lowers), len(known) - 1)
+        found = known[positions] == lowers
+        codes[found] = HASH_LEVEL_CODES['level'][positions[found]]
+    return tuple(np.bincount(codes, minlength=len(CEFR_LEVELS) + 1).tolist())
+
+
+# Worker threads for batch analysis, installed as the loop's default executor
+# in main(). Each batch keeps at most one analysis per worker in flight.
+BATCH_WORKERS = os.cpu_count() or 1
+executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="pycefrizer")
+
+
+CEFR_LEVELS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
+
+# Inverted CEFR level -> words index over the read-only word lookup, with
+# the serialized JSON responses cached alongside it, keyed by (key, pretty)
+# ('*' holds all levels, 'base:<level>' the unique base forms of a level)
+LEVEL_INDEX: Dict[str, List[Dict[str, str]]] = {}
+LEVEL_JSON: Dict[Tuple[str, bool], str] = {}
+
+# The same entries as parallel 'base_form', 'pos' and 'level' (code) arrays,
+# so a level can be selected with a vectorized mask
+WORD_COLUMNS: Dict[str, np.ndarray] = {}
+
+# CEFR level codes (0 = not in dictionary, 1 = A1 ... 6 = C2) of the words,
+# keyed by the sorted spaCy string IDs ('hash') of the words so a text's
+# LOWER attribute array can be looked up with a single searchsorted
+HASH_LEVEL_CODES: Dict[str, np.ndarray] = {}
+_LEVEL_CODES = {level: code for code, level in enumerate(CEFR_LEVELS, 1)}
+_level_index_source: Optional[Dict[str, Dict[str, str]]] = None
+
+
+def _get_level_index() -> Dict[str, List[Dict[str, str]]]:
+    """Return the level index, rebuilding it if the word lookup was reloaded.
+    
+    HASH_LEVEL_CODES and WORD_COLUMNS are rebuilt from the same lookup at
+    the same time.
+    
+    Returns:
+        Dictionary mapping each CEFR level to its words sorted alphabetically
+    """
+    global _level_index_source
+    
+    word_lookup = analyzer.resources.word_lookup
+    if word_lookup is not _level_index_source:
+        index: Dict[str, List[Dict[str, str]]] = {level: [] for level in CEFR_LEVELS}
+        base_forms: List[Tuple[str, str, int]] = []
+        word_ids: List[int] = []
+        for word in sorted(word_lookup):
+            entry = word_lookup[word]
+            level = entry.get('CEFR', '').upper()
+            level_words = index.get(level)
+            if level_words is not None:
+                pos = entry.get('pos', 'unknown')
+                level_words.append({'word': word, 'pos': pos})
+                base_forms.append((entry.get('base_form', word), pos, _LEVEL_CODES[level]))
+                word_ids.append(get_string_id(word))
+        
+        columns = list(zip(*base_forms)) or [(), (), ()]
+        hashes = np.array(word_ids, dtype=np.uint64)
+        order = np.argsort(hashes)
+        
+        LEVEL_INDEX.clear()
+        LEVEL_INDEX.update(index)
+        LEVEL_JSON.clear()
+        WORD_COLUMNS.update(
+            base_form=np.array(columns[0], dtype=object),
+            pos=np.array(columns[1], dtype=object),
+            level=np.array(columns[2], dtype=np.uint8)
+        )
+        HASH_LEVEL_CODES['hash'] = hashes[order]
+        HASH_LEVEL_CODES['level'] = WORD_COLUMNS['level'][order]
+        _cefr_cache.cache_clear()
+        _count_levels.cache_clear()
+        _level_index_source = word_lookup
+    
+    return LEVEL_INDEX
+
+
+# Build the index up front so the first word list request is not slowed down
+_get_level_index()
+
+
+# Optional argument of every tool that returns JSON
+_PRETTY_PROPERTY = {
+    "type": "boolean",
+    "default": False,
+    "description": "Indent the JSON response for human readers"
+}
+
+# Tool definitions are static, so they are built once at import
+_TOOLS: List[Tool] = [
+    Tool(
+        name="analyze_text",
+        description="Analyze English text and return CEFR-J level assessment with metric scores",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "English text to analyze (10-10,000 words)"
                 },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="get_word_cefr_level",
-            description="Get the CEFR level of a single English word",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word": {
-                        "type": "string",
-                        "description": "English word to look up"
-                    }
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_word_cefr_level",
+        description="Get the CEFR level of a single English word",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word": {
+                    "type": "string",
+                    "description": "English word to look up"
+                }
+            },
+            "required": ["word"]
+        }
+    ),
+    Tool(
+        name="get_unused_words",
+        description="Find unused vocabulary from a specific CEFR level in the given text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "level": {
+                    "type": "string",
+                    "description": "CEFR level to search (A1, A2, B1, B2, C1, C2)",
+                    "enum": ["A1", "A2", "B1", "B2", "C1", "C2"]
                 },
-                "required": ["word"]
-            }
-        ),
-        Tool(
-            name="get_unused_words",
-            description="Find unused vocabulary from a specific CEFR level in the given text",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "level": {
-                        "type": "string",
-                        "description": "CEFR level to search (A1, A2, B1, B2, C1, C2)",
-                        "enum": ["A1", "A2", "B1", "B2", "C1", "C2"]
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "English text to analyze"
-                    }
+                "text": {
+                    "type": "string",
+                    "description": "English text to analyze"
                 },
-                "required": ["level", "text"]
-            }
-        ),
-        Tool(
-            name="get_detailed_analysis",
-            description="Get detailed analysis including raw metric values and processed scores",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "English text to analyze (10-10,000 words)"
-                    }
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["level", "text"]
+        }
+    ),
+    Tool(
+        name="get_detailed_analysis",
+        description="Get detailed analysis including raw metric values and processed scores",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "English text to analyze (10-10,000 words)"
                 },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="analyze_file",
-            description="Analyze text from a file and return CEFR-J level assessment",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to text file to analyze"
-                    }
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="analyze_file",
+        description="Analyze text from a file and return CEFR-J level assessment",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to text file to analyze"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="get_available_words",
-            description="Get all available words in the dictionary for a specific CEFR level",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "level": {
-                        "type": "string",
-                        "description": "CEFR level to retrieve words for",
-                        "enum": ["A1", "A2", "B1", "B2", "C1", "C2"]
-                    }
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="batch_analyze",
+        description="Analyze multiple texts and return CEFR-J levels for each",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "texts": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of English texts to analyze"
                 },
-                "required": ["level"]
-            }
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["texts"]
+        }
+    ),
+    Tool(
+        name="get_cefr_statistics",
+        description="Get statistics about CEFR level distribution in the text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "English text to analyze"
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_cache_stats",
+        description="Get hit and miss statistics for the server's result caches",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_available_words",
+        description="Get all available words in the dictionary for a specific CEFR level",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "level": {
+                    "type": "string",
+                    "description": "CEFR level to retrieve words for",
+                    "enum": ["A1", "A2", "B1", "B2", "C1", "C2"]
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": ["level"]
+        }
+    ),
+    Tool(
+        name="get_cefr_words",
+        description=(
+            "Get all unique words (base forms) from a specific CEFR level with their "
+            "parts of speech, or all dictionary words grouped by CEFR level"
         ),
-        Tool(
-            name="get_cefr_words",
-            description="Get all available words from the dictionary grouped by CEFR levels",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        )
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "level": {
+                    "type": "string",
+                    "description": "CEFR level (A1, A2, B1, B2, C1, C2); omit for all levels",
+                    "enum": ["A1", "A2", "B1", "B2", "C1", "C2"]
+                },
+                "pretty": _PRETTY_PROPERTY
+            },
+            "required": []
+        }
+    )
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available tools"""
+    return _TOOLS
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls"""
     try:
+        pretty = bool(arguments.get("pretty", False))
+        
         if name == "analyze_text":
-            result = await analyze_text(arguments.get("text", ""))
+            result = await analyze_text(arguments.get("text", ""), pretty)
         elif name == "get_word_cefr_level":
             result = await get_word_cefr_level(arguments.get("word", ""))
         elif name == "get_unused_words":
             result = await get_unused_words(
                 arguments.get("level", ""),
-                arguments.get("text", "")
+                arguments.get("text", ""),
+                pretty
             )
         elif name == "get_detailed_analysis":
-            result = await get_detailed_analysis(arguments.get("text", ""))
+            result = await get_detailed_analysis(arguments.get("text", ""), pretty)
         elif name == "analyze_file":
-            result = await analyze_file(arguments.get("file_path", ""))
+            result = await analyze_file(arguments.get("file_path", ""), pretty)
+        elif name == "batch_analyze":
+            result = await batch_analyze(arguments.get("texts", []), pretty)
+        elif name == "get_cefr_statistics":
+            result = await get_cefr_statistics(arguments.get("text", ""), pretty)
+        elif name == "get_cache_stats":
+            result = await get_cache_stats(pretty)
         elif name == "get_available_words":
-            result = await get_available_words(arguments.get("level", ""))
+            result = await get_available_words(arguments.get("level", ""), pretty)
         elif name == "get_cefr_words":
-            result = await get_cefr_words()
+            result = await get_cefr_words(arguments.get("level"), pretty)
         else:
             result = f"Unknown tool: {name}"
         
@@ -166,19 +378,19 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def analyze_text(text: str) -> str:
+async def analyze_text(text: str, pretty: bool = False) -> str:
     """
     Analyze English text and return CEFR-J level assessment with metric scores.
     
     Args:
         text: English text to analyze (10-10,000 words)
+        pretty: Indent the JSON response
         
     Returns:
         JSON string with CEFR-J level and 8 metric scores
     """
     try:
-        result = analyzer.analyze(text)
-        return result
+        return await asyncio.to_thread(_cached_analysis, text, pretty)
     except PyCEFRizerError as e:
         return f"Error analyzing text: {str(e)}"
     except Exception as e:
@@ -197,27 +409,28 @@ async def get_word_cefr_level(word: str) -> str:
         CEFR level of the word (A1, A2, B1, B2, C1, C2) or "Not found"
     """
     try:
-        result = analyzer.get_word_cefr_level(word)
+        result = _cefr_cache(word)
         return result if result else "Not found"
     except Exception as e:
         logger.error(f"Error in get_word_cefr_level: {str(e)}")
         return f"Error: {str(e)}"
 
 
-async def get_unused_words(level: str, text: str) -> str:
+async def get_unused_words(level: str, text: str, pretty: bool = False) -> str:
     """
     Find unused vocabulary from a specific CEFR level in the given text.
     
     Args:
         level: CEFR level to search (A1, A2, B1, B2, C1, C2)
         text: English text to analyze
+        pretty: Indent the JSON response
         
     Returns:
         JSON string mapping unused words to their parts of speech
     """
     try:
-        result = analyzer.get_unused_words(level, text)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        result = await asyncio.to_thread(analyzer.get_unused_words, level, text)
+        return _dumps(result, pretty)
     except PyCEFRizerError as e:
         return f"Error: {str(e)}"
     except Exception as e:
@@ -225,19 +438,19 @@ async def get_unused_words(level: str, text: str) -> str:
         return f"Error: {str(e)}"
 
 
-async def get_detailed_analysis(text: str) -> str:
+async def get_detailed_analysis(text: str, pretty: bool = False) -> str:
     """
     Get detailed analysis including raw metric values and processed scores.
     
     Args:
         text: English text to analyze (10-10,000 words)
+        pretty: Indent the JSON response
         
     Returns:
         JSON string with detailed metrics and scores
     """
     try:
-        result = analyzer.get_detailed_analysis(text)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return await asyncio.to_thread(_cached_detailed_analysis, text, pretty)
     except PyCEFRizerError as e:
         return f"Error: {str(e)}"
     except Exception as e:
@@ -245,12 +458,13 @@ async def get_detailed_analysis(text: str) -> str:
         return f"Unexpected error: {str(e)}"
 
 
-async def analyze_file(file_path: str) -> str:
+async def analyze_file(file_path: str, pretty: bool = False) -> str:
     """
     Analyze text from a file and return CEFR-J level assessment.
     
     Args:
         file_path: Path to text file to analyze
+        pretty: Indent the JSON response
         
     Returns:
         JSON string with CEFR-J level and 8 metric scores
@@ -263,16 +477,23 @@ async def analyze_file(file_path: str) -> str:
         if not path.is_file():
             return f"Error: Path is not a file: {file_path}"
         
-        # Read file content
+        # Reject oversized files before reading them into memory
+        size = path.stat().st_size
+        if size > config.MAX_INPUT_BYTES:
+            return (
+                f"Error: File is too large. Maximum {config.MAX_INPUT_BYTES} bytes "
+                f"allowed, but got {size} bytes."
+            )
+        
+        # Read the whole file in a worker thread and decode it in one step
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            data = await asyncio.to_thread(path.read_bytes)
+            text = data.decode('utf-8')
         except Exception as e:
             return f"Error reading file: {str(e)}"
         
         # Analyze the text
-        result = analyzer.analyze(text)
-        return result
+        return await asyncio.to_thread(_cached_analysis, text, pretty)
         
     except PyCEFRizerError as e:
         return f"Error analyzing file: {str(e)}"
@@ -281,91 +502,253 @@ async def analyze_file(file_path: str) -> str:
         return f"Unexpected error: {str(e)}"
 
 
-async def get_available_words(level: str) -> str:
+def _safe_analyze(index: int, text: str, pretty: bool = False) -> bytes:
+    """Analyze one text of a batch, capturing errors in the result.
+    
+    The item is serialized here, in the worker thread, so the batch never
+    holds every result dict at once.
+    
+    Args:
+        index: Position of the text in the batch
+        text: English text to analyze
+        pretty: Indent the fragment for its position in the batch response
+        
+    Returns:
+        JSON fragment with the index and either the analysis result or an
+        error
     """
-    Get all available words in the dictionary for a specific CEFR level.
+    try:
+        item = {'index': index, 'result': analyzer.analyze(text)}
+    except PyCEFRizerError as e:
+        item = {'index': index, 'error': str(e)}
+    except Exception as e:
+        logger.error(f"Unexpected error in batch_analyze for text {index}: {str(e)}")
+        item = {'index': index, 'error': f"Unexpected error: {str(e)}"}
+    
+    if not pretty:
+        return _jsonio.dumps(item, pretty=False)
+    
+    # JSON strings cannot contain raw newlines, so this only shifts the layout
+    return b'    ' + _jsonio.dumps(item).replace(b'\n', b'\n    ')
+
+
+async def _analyze_in_thread(
+    semaphore: asyncio.Semaphore, index: int, text: str, pretty: bool
+) -> bytes:
+    """Run _safe_analyze in a worker thread, bounded by the batch semaphore."""
+    async with semaphore:
+        return await asyncio.to_thread(_safe_analyze, index, text, pretty)
+
+
+async def batch_analyze(texts: List[str], pretty: bool = False) -> str:
+    """
+    Analyze multiple texts and return CEFR-J levels for each.
+    
+    Texts are analyzed concurrently in worker threads; results keep the
+    order of the input list.
     
     Args:
-        level: CEFR level to retrieve words for (A1, A2, B1, B2, C1, C2)
+        texts: List of English texts to analyze
+        pretty: Indent the JSON response
         
     Returns:
-        JSON string listing all words at the specified level
+        JSON string with the result or error for each text
     """
     try:
-        # Get all words at the specified level
-        all_words = analyzer.word_lookup_manager.word_lookup
-        level_words = []
+        # Created per call, since a semaphore is bound to the running loop
+        semaphore = asyncio.Semaphore(BATCH_WORKERS)
+        fragments = await asyncio.gather(
+            *[_analyze_in_thread(semaphore, i, text, pretty) for i, text in enumerate(texts)]
+        )
+        if not fragments:
+            return _dumps({'total_texts': 0, 'results': []}, pretty)
         
-        for word, entries in all_words.items():
-            for entry in entries:
-                if entry.get('cefr', '').upper() == level.upper():
-                    level_words.append({
-                        'word': word,
-                        'pos': entry.get('pos', 'unknown')
-                    })
+        # Same layout as serializing the whole response with _dumps
+        if pretty:
+            head, separator, tail = b'{\n  "total_texts": %d,\n  "results": [\n', b',\n', b'\n  ]\n}'
+        else:
+            head, separator, tail = b'{"total_texts":%d,"results":[', b',', b']}'
+        return b''.join([head % len(texts), separator.join(fragments), tail]).decode('utf-8')
+    except Exception as e:
+        logger.error(f"Error in batch_analyze: {str(e)}")
+        return f"Error: {str(e)}"
+
+
+async def get_cefr_statistics(text: str, pretty: bool = False) -> str:
+    """
+    Get statistics about CEFR level distribution in the text.
+    
+    Counts the alphabetic, non-stop-word tokens of the text by the CEFR
+    level of their surface form.
+    
+    Args:
+        text: English text to analyze
+        pretty: Indent the JSON response
         
-        # Sort words alphabetically
-        level_words.sort(key=lambda x: x['word'])
+    Returns:
+        JSON string with word counts and percentages per CEFR level
+    """
+    try:
+        _get_level_index()
+        counts = await asyncio.to_thread(_count_levels, text)
+        total = sum(counts)
         
+        labels = CEFR_LEVELS + ['Unknown']
+        # Code 0 (not in dictionary) is reported last as 'Unknown'
+        label_counts = counts[1:] + counts[:1]
         result = {
-            'level': level.upper(),
-            'total_words': len(level_words),
-            'words': level_words
+            'total_words': total,
+            'level_counts': dict(zip(labels, label_counts)),
+            'level_distribution': {
+                label: round(count / total * 100, 2) if total else 0.0
+                for label, count in zip(labels, label_counts)
+            }
         }
-        
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _dumps(result, pretty)
         
     except Exception as e:
-        logger.error(f"Error in get_available_words: {str(e)}")
+        logger.error(f"Error in get_cefr_statistics: {str(e)}")
         return f"Error: {str(e)}"
 
 
-async def get_cefr_words() -> str:
+async def get_cache_stats(pretty: bool = False) -> str:
     """
-    Get all available words from the dictionary grouped by CEFR levels.
+    Get hit and miss statistics for the server's result caches.
     
+    Args:
+        pretty: Indent the JSON response
+    
+    Returns:
+        JSON string with hits, misses, maxsize and currsize per cache
+    """
+    caches = {
+        'analyze': _cached_analysis,
+        'detailed_analysis': _cached_detailed_analysis,
+        'cefr_statistics': _count_levels,
+        'word_cefr_level': _cefr_cache,
+    }
+    return _dumps(
+        {name: cache.cache_info()._asdict() for name, cache in caches.items()},
+        pretty
+    )
+
+
+async def get_available_words(level: str, pretty: bool = False) -> str:
+    """
+    Get all available words in the dictionary for a specific CEFR level.
+    
+    Args:
+        level: CEFR level to retrieve words for (A1, A2, B1, B2, C1, C2)
+        pretty: Indent the JSON response
+        
     Returns:
-        JSON string with words grouped by CEFR levels
+        JSON string listing all words at the specified level
     """
     try:
-        # Initialize result structure
-        cefr_levels = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
-        result = {level: [] for level in cefr_levels}
+        level = level.upper()
+        index = _get_level_index()
+        
+        cached = LEVEL_JSON.get((level, pretty))
+        if cached is None:
+            level_words = index.get(level, [])
+            result = {
+                'level': level,
+                'total_words': len(level_words),
+                'words': level_words
+            }
+            cached = _dumps(result, pretty)
+            if level in index:
+                LEVEL_JSON[(level, pretty)] = cached
+        
+        return cached
         
-        # Get all words from the lookup
-        all_words = analyzer.word_lookup_manager.word_lookup
+    except Exception as e:
+        logger.error(f"Error in get_available_words: {str(e)}")
+        return f"Error: {str(e)}"
+
+
+def _get_level_base_forms(level: str, pretty: bool = False) -> str:
+    """Serialize the unique (base form, part of speech) pairs of a level.
+    
+    Args:
+        level: Upper-case CEFR level
+        pretty: Indent the JSON response
         
-        # Group words by CEFR level
-        for word, entries in all_words.items():
-            for entry in entries:
-                level = entry.get('cefr', '').upper()
-                if level in cefr_levels:
-                    result[level].append({
-                        'word': word,
-                        'pos': entry.get('pos', 'unknown')
-                    })
+    Returns:
+        JSON string with the level's unique base forms
+    """
+    _get_level_index()
+    key = (f"base:{level}", pretty)
+    cached = LEVEL_JSON.get(key)
+    if cached is not None:
+        return cached
+    
+    code = _LEVEL_CODES.get(level)
+    if code is None:
+        return f"Error: Invalid CEFR level: {level}"
+    
+    mask = WORD_COLUMNS['level'] == code
+    pairs = sorted(set(zip(
+        WORD_COLUMNS['base_form'][mask].tolist(),
+        WORD_COLUMNS['pos'][mask].tolist()
+    )))
+    result = {
+        'level': level,
+        'total_unique_words': len(pairs),
+        'words': [{'word': word, 'pos': pos} for word, pos in pairs]
+    }
+    cached = LEVEL_JSON[key] = _dumps(result, pretty)
+    return cached
+
+
+async def get_cefr_words(level: Optional[str] = None, pretty: bool = False) -> str:
+    """
+    Get unique words from the dictionary for one or all CEFR levels.
+    
+    Args:
+        level: CEFR level (A1, A2, B1, B2, C1, C2). If omitted, all
+            dictionary words are returned grouped by CEFR level.
+        pretty: Indent the JSON response
+    
+    Returns:
+        JSON string with the unique base forms and parts of speech of the
+        level, or with words grouped by CEFR levels
+    """
+    try:
+        if level:
+            return _get_level_base_forms(level.upper(), pretty)
         
-        # Sort words in each level alphabetically
-        for level in cefr_levels:
-            result[level].sort(key=lambda x: x['word'])
+        index = _get_level_index()
         
-        # Add summary statistics
-        summary = {
-            'total_words': sum(len(words) for words in result.values()),
-            'words_by_level': {level: len(words) for level, words in result.items()},
-            'words': result
-        }
+        cached = LEVEL_JSON.get(('*', pretty))
+        if cached is None:
+            summary = {
+                'total_words': sum(len(words) for words in index.values()),
+                'words_by_level': {level: len(words) for level, words in index.items()},
+                'words': index
+            }
+            cached = LEVEL_JSON[('*', pretty)] = _dumps(summary, pretty)
         
-        return json.dumps(summary, ensure_ascii=False, indent=2)
+        return cached
         
     except Exception as e:
         logger.error(f"Error in get_cefr_words: {str(e)}")
         return f"Error: {str(e)}"
 
 
+def _warm_up() -> None:
+    """Load lazy resources and run the pipeline once on a dummy text."""
+    _ = analyzer.resources.coca_frequencies
+    analyzer.nlp("Warm up the pipeline.")
+
+
 async def main():
     """Main entry point for the MCP server."""
     logger.info("Starting PyCEFRizer MCP Server...")
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    # Pay the one-time costs before serving, not on the first tool call
+    await asyncio.to_thread(_warm_up)
     
     try:
         # Run the server using stdio transport
@@ -1,9 +1,14 @@
 """Metric calculation functions for PyCEFRizer."""
 
+import heapq
 import math
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import textstat
+from spacy.attrs import IS_PUNCT, IS_SPACE, IS_STOP, LEMMA, LOWER, POS
+from spacy.symbols import IDS, VERB
 from spacy.tokens import Doc, Token
 
 from .config import config
@@ -11,6 +16,43 @@ from .exceptions import MetricCalculationError
 from .logger import logger
 from .resources import ResourceManager
 
+# Entries kept per word memo before it is cleared and refilled
+_WORD_CACHE_LIMIT = 200_000
+
+# Token attributes read in one Doc.to_array call, in row order
+_TOKEN_ATTRS = [LOWER, LEMMA, POS, IS_PUNCT, IS_SPACE, IS_STOP]
+
+# Content word POS tags as spaCy symbol IDs, comparable with the POS column
+_CONTENT_POS_ARRAY = np.array(sorted(IDS[tag] for tag in config.CONTENT_POS_TAGS), dtype=np.uint64)
+
+# Universal POS symbol IDs are consecutive from ADJ; subtracting this offset
+# gives each tag its own bit (1-20), leaving bit 0 for untagged tokens
+_POS_BIT_OFFSET = IDS['ADJ'] - 1
+
+
+@dataclass
+class _DocStats:
+    """Counts gathered from a Doc in a single traversal for the metrics."""
+    
+    # Token-level counts (CVV1, BperA, AvrDiff, AvrFreqRank)
+    verb_tokens: int = 0
+    verb_types: Set[str] = field(default_factory=set)
+    a_level_count: int = 0
+    b_level_count: int = 0
+    difficulty_sum: float = 0.0
+    difficulty_count: int = 0
+    ranks: List[int] = field(default_factory=list)
+    
+    # Sentence-level counts (VperSent, POStypes)
+    num_sentences: int = 0
+    total_verbs: int = 0
+    total_pos_types: int = 0
+    sentence_error: Optional[Exception] = None
+    
+    # Noun phrase lengths (LenNP)
+    np_lengths: List[int] = field(default_factory=list)
+    noun_chunk_error: Optional[Exception] = None
+
 
 class MetricsCalculator:
     """Calculates all metrics for PyCEFRizer analysis."""
@@ -22,7 +64,168 @@ class MetricsCalculator:
             resource_manager: ResourceManager instance for accessing linguistic data
         """
         self.resources = resource_manager
+        # Stats of the most recent Doc, stored as one (doc, stats) tuple so
+        # concurrent callers never pair a doc with another doc's stats
+        self._last_stats: Optional[Tuple[Doc, _DocStats]] = None
+        
+        # Per-word memos for the token loop, keyed by spaCy string hashes.
+        # Levels are stored as their config.CEFR_LEVELS value (0 if unknown):
+        # LOWER -> (frequency rank, level value) and
+        # LEMMA -> (lowercased lemma, level value, whether it is a be-verb)
+        self._text_cache: Dict[int, Tuple[int, int]] = {}
+        self._lemma_cache: Dict[int, Tuple[str, int, bool]] = {}
         logger.debug("MetricsCalculator initialized")
+    
+    def clear_cache(self) -> None:
+        """Clear the per-word lookup memos and the memoized doc stats."""
+        self._text_cache.clear()
+        self._lemma_cache.clear()
+        self._last_stats = None
+    
+    def _collect(self, doc: Doc) -> _DocStats:
+        """Gather the counts for all doc-based metrics in one traversal.
+        
+        Token attributes are read with one Doc.to_array call and counted
+        with NumPy; Python-level work is limited to one lookup per distinct
+        word and lemma, one pass over the sentences and one over the noun
+        chunks. The result is memoized for the most recent doc, so the individual
+        calculate_* methods share a single traversal.
+        
+        Args:
+            doc: spaCy Doc object
+            
+        Returns:
+            Collected counts for the doc
+        """
+        cached = self._last_stats
+        if cached is not None and cached[0] is doc:
+            return cached[1]
+        
+        stats = _DocStats()
+        
+        text_cache = self._text_cache
+        lemma_cache = self._lemma_cache
+        if len(text_cache) + len(lemma_cache) > _WORD_CACHE_LIMIT:
+            self.clear_cache()
+        
+        strings = doc.vocab.strings
+        level_values = config.CEFR_LEVELS
+        get_word_level = self.resources.get_word_level
+        get_word_frequency_rank = self.resources.get_word_frequency_rank
+        
+        # Read the token attributes as integers in one call. Words are looked
+        # up once per distinct hash (strings are only resolved the first time
+        # a word is seen); the per-token work is done with NumPy.
+        attrs = doc.to_array(_TOKEN_ATTRS)
+        pos_ids = attrs[:, 2]
+        is_punct = attrs[:, 3] != 0
+        
+        word_ids, word_index = np.unique(attrs[:, 0], return_inverse=True)
+        word_entries = []
+        for lower in word_ids.tolist():
+            entry = text_cache.get(lower)
+            if entry is None:
+                word_text = strings[lower]
+                entry = text_cache[lower] = (
+                    get_word_frequency_rank(word_text),
+                    level_values.get(get_word_level(word_text) or "", 0)
+                )
+            word_entries.append(entry)
+        word_ranks = np.array([entry[0] for entry in word_entries], dtype=np.int64)
+        word_levels = np.array([entry[1] for entry in word_entries], dtype=np.int64)
+        
+        # Ranks of all tokens except punctuation and spaces
+        counted = ~is_punct & (attrs[:, 4] == 0)
+        stats.ranks = word_ranks[word_index[counted]].tolist()
+        
+        # Verbs and content words also need their lemma
+        is_verb = pos_ids == VERB
+        is_content = (
+            np.isin(pos_ids, _CONTENT_POS_ARRAY) & ~is_punct & (attrs[:, 5] == 0)
+        )
+        needs_lemma = is_verb | is_content
+        
+        lemma_ids, lemma_index = np.unique(attrs[needs_lemma, 1], return_inverse=True)
+        lemma_entries = []
+        for lemma_id in lemma_ids.tolist():
+            lemma_entry = lemma_cache.get(lemma_id)
+            if lemma_entry is None:
+                lemma = strings[lemma_id].lower()
+                lemma_entry = lemma_cache[lemma_id] = (
+                    lemma,
+                    level_values.get(get_word_level(lemma) or "", 0),
+                    lemma in config.BE_VERBS
+                )
+            lemma_entries.append(lemma_entry)
+        lemma_levels = np.array([entry[1] for entry in lemma_entries], dtype=np.int64)
+        lemma_is_be = np.array([entry[2] for entry in lemma_entries], dtype=bool)
+        
+        # Verbs other than be-verbs
+        verb_lemmas = lemma_index[is_verb[needs_lemma]]
+        verb_lemmas = verb_lemmas[~lemma_is_be[verb_lemmas]]
+        stats.verb_tokens = len(verb_lemmas)
+        stats.verb_types = {lemma_entries[index][0] for index in np.unique(verb_lemmas).tolist()}
+        
+        # Content words: try the token text first, then the lemma. Index 0
+        # of level_counts counts words with an unknown level.
+        content_levels = word_levels[word_index[is_content]]
+        content_levels = np.where(
+            content_levels > 0,
+            content_levels,
+            lemma_levels[lemma_index[is_content[needs_lemma]]]
+        )
+        level_counts = np.bincount(
+            content_levels, minlength=max(level_values.values()) + 1
+        ).tolist()
+        
+        stats.a_level_count = level_counts[level_values['A1']] + level_counts[level_values['A2']]
+        stats.b_level_count = level_counts[level_values['B1']] + level_counts[level_values['B2']]
+        stats.difficulty_sum = float(sum(
+            value * count for value, count in enumerate(level_counts)
+        ))
+        stats.difficulty_count = sum(level_counts[1:])
+        
+        # Sentence boundaries and noun chunks need a parse; keep any failure
+        # so only the metrics depending on them report it
+        try:
+            sent_starts = [sent.start for sent in doc.sents]
+            
+            pos_ids = attrs[:, 2]
+            stats.num_sentences = len(sent_starts)
+            stats.total_verbs = int(np.count_nonzero(pos_ids == VERB))
+            
+            if sent_starts:
+                # One bit per POS tag, none for punctuation; OR-ing the bits
+                # of each sentence gives its set of distinct tags
+                bit_index = np.where(pos_ids > _POS_BIT_OFFSET, pos_ids - _POS_BIT_OFFSET, 0)
+                pos_bits = np.left_shift(np.uint64(1), bit_index.astype(np.uint64))
+                pos_bits[attrs[:, 3] != 0] = 0
+                sent_masks = np.bitwise_or.reduceat(pos_bits, sent_starts)
+                stats.total_pos_types = sum(bin(mask).count('1') for mask in sent_masks.tolist())
+        except Exception as e:
+            stats.sentence_error = e
+        
+        try:
+            # Chunk offsets as a flat array of (start, end) pairs
+            bounds = np.fromiter(
+                (offset for chunk in doc.noun_chunks for offset in (chunk.start, chunk.end)),
+                dtype=np.int64
+            )
+            starts, ends = bounds[0::2], bounds[1::2]
+            
+            # Punctuation tokens before each offset, so the punctuation in a
+            # span is a difference of two entries
+            punct_before = np.zeros(len(doc) + 1, dtype=np.int64)
+            np.cumsum(is_punct, out=punct_before[1:])
+            
+            # Tokens per noun phrase, excluding punctuation
+            np_lengths = (ends - starts) - (punct_before[ends] - punct_before[starts])
+            stats.np_lengths = np_lengths[np_lengths > 0].tolist()
+        except Exception as e:
+            stats.noun_chunk_error = e
+        
+        self._last_stats = (doc, stats)
+        return stats
         
     def calculate_cvv1(self, doc: Doc) -> float:
         """Calculate CVV1 (Corrected Verb Variation 1).
@@ -40,25 +243,18 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            verb_tokens: List[str] = []
-            verb_types: Set[str] = set()
-            
-            for token in doc:
-                # Check if it's a verb and not a be-verb
-                if token.pos_ == 'VERB' and token.lemma_.lower() not in config.BE_VERBS:
-                    verb_tokens.append(token.text.lower())
-                    verb_types.add(token.lemma_.lower())
+            stats = self._collect(doc)
             
             # Calculate CVV1
-            num_tokens = len(verb_tokens)
-            num_types = len(verb_types)
+            num_tokens = stats.verb_tokens
+            num_types = len(stats.verb_types)
             
             if num_types == 0:
                 logger.debug("No verbs found for CVV1 calculation")
                 return 0.0
                 
             cvv1 = num_tokens / math.sqrt(2 * num_types)
-            logger.debug(f"CVV1: {cvv1:.4f} (tokens: {num_tokens}, types: {num_types})")
+            logger.debug("CVV1: %.4f (tokens: %d, types: %d)", cvv1, num_tokens, num_types)
             return cvv1
             
         except Exception as e:
@@ -77,17 +273,17 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            words_by_level = self.resources.get_content_words_by_level(doc)
+            stats = self._collect(doc)
             
-            a_level_count = len(words_by_level['A1']) + len(words_by_level['A2'])
-            b_level_count = len(words_by_level['B1']) + len(words_by_level['B2'])
+            a_level_count = stats.a_level_count
+            b_level_count = stats.b_level_count
             
             if a_level_count == 0:
                 logger.debug("No A-level words found for BperA calculation")
                 return 0.0
                 
             bpera = b_level_count / a_level_count
-            logger.debug(f"BperA: {bpera:.4f} (B-level: {b_level_count}, A-level: {a_level_count})")
+            logger.debug("BperA: %.4f (B-level: %d, A-level: %d)", bpera, b_level_count, a_level_count)
             return bpera
             
         except Exception as e:
@@ -106,24 +302,19 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            total_pos_types = 0
-            num_sentences = 0
-            
-            for sent in doc.sents:
-                pos_tags: Set[str] = set()
-                for token in sent:
-                    if not token.is_punct:  # Exclude punctuation
-                        pos_tags.add(token.pos_)
-                
-                total_pos_types += len(pos_tags)
-                num_sentences += 1
+            stats = self._collect(doc)
+            if stats.sentence_error is not None:
+                raise stats.sentence_error
+            
+            total_pos_types = stats.total_pos_types
+            num_sentences = stats.num_sentences
             
             if num_sentences == 0:
                 logger.debug("No sentences found for POStypes calculation")
                 return 0.0
                 
             avg_postypes = total_pos_types / num_sentences
-            logger.debug(f"POStypes: {avg_postypes:.4f} (sentences: {num_sentences})")
+            logger.debug("POStypes: %.4f (sentences: %d)", avg_postypes, num_sentences)
             return avg_postypes
             
         except Exception as e:
@@ -143,7 +334,7 @@ class MetricsCalculator:
         """
         try:
             ari = textstat.automated_readability_index(text)
-            logger.debug(f"ARI: {ari:.4f}")
+            logger.debug("ARI: %.4f", ari)
             return float(ari)
         except Exception as e:
             logger.warning(f"Failed to calculate ARI: {e}")
@@ -164,37 +355,18 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            content_words = self.resources.get_content_words(doc)
+            stats = self._collect(doc)
             
-            if not content_words:
-                logger.debug("No content words found for AvrDiff calculation")
-                return 0.0
-                
-            total_difficulty = 0.0
-            counted_words = 0
-            
-            for token in content_words:
-                # Try both token text and lemma
-                word_text = token.text.lower()
-                word_lemma = token.lemma_.lower()
-                
-                # First try exact match with token text
-                difficulty = self.resources.get_word_difficulty(word_text)
-                
-                # If not found, try with lemma
-                if difficulty == 0:
-                    difficulty = self.resources.get_word_difficulty(word_lemma)
-                    
-                if difficulty > 0:  # Only count words found in word_lookup
-                    total_difficulty += difficulty
-                    counted_words += 1
+            # Only words found in word_lookup are counted
+            total_difficulty = stats.difficulty_sum
+            counted_words = stats.difficulty_count
             
             if counted_words == 0:
                 logger.debug("No words with difficulty scores found")
                 return 0.0
                 
             avg_diff = total_difficulty / counted_words
-            logger.debug(f"AvrDiff: {avg_diff:.4f} (words: {counted_words})")
+            logger.debug("AvrDiff: %.4f (words: %d)", avg_diff, counted_words)
             return avg_diff
             
         except Exception as e:
@@ -215,29 +387,21 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            ranks: List[int] = []
+            # Ranks of all tokens except punctuation and spaces
+            ranks = self._collect(doc).ranks
+            exclude = config.EXCLUDE_INFREQUENT_COUNT
             
-            for token in doc:
-                # Skip punctuation and spaces
-                if token.is_punct or token.is_space:
-                    continue
-                    
-                rank = self.resources.get_word_frequency_rank(token.text.lower())
-                ranks.append(rank)
-            
-            if len(ranks) <= config.EXCLUDE_INFREQUENT_COUNT:
+            if len(ranks) <= exclude:
                 # If we have 3 or fewer words, just average them all
-                avg_rank = sum(ranks) / len(ranks) if ranks else 0.0
+                num_words = len(ranks)
+                avg_rank = sum(ranks) / num_words if ranks else 0.0
             else:
-                # Sort ranks to find the most infrequent (highest ranks)
-                ranks.sort()
-                
-                # Remove the most infrequent words
-                ranks = ranks[:-config.EXCLUDE_INFREQUENT_COUNT]
-                
-                avg_rank = sum(ranks) / len(ranks) if ranks else 0.0
+                # Remove the most infrequent words (highest ranks); selecting
+                # them is linear, unlike sorting all ranks
+                num_words = len(ranks) - exclude
+                avg_rank = (sum(ranks) - sum(heapq.nlargest(exclude, ranks))) / num_words
             
-            logger.debug(f"AvrFreqRank: {avg_rank:.4f} (words: {len(ranks)})")
+            logger.debug("AvrFreqRank: %.4f (words: %d)", avg_rank, num_words)
             return avg_rank
             
         except Exception as e:
@@ -256,20 +420,19 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            total_verbs = 0
-            num_sentences = 0
+            stats = self._collect(doc)
+            if stats.sentence_error is not None:
+                raise stats.sentence_error
             
-            for sent in doc.sents:
-                verb_count = sum(1 for token in sent if token.pos_ == 'VERB')
-                total_verbs += verb_count
-                num_sentences += 1
+            total_verbs = stats.total_verbs
+            num_sentences = stats.num_sentences
             
             if num_sentences == 0:
                 logger.debug("No sentences found for VperSent calculation")
                 return 0.0
                 
             avg_verbs = total_verbs / num_sentences
-            logger.debug(f"VperSent: {avg_verbs:.4f} (verbs: {total_verbs}, sentences: {num_sentences})")
+            logger.debug("VperSent: %.4f (verbs: %d, sentences: %d)", avg_verbs, total_verbs, num_sentences)
             return avg_verbs
             
         except Exception as e:
@@ -290,26 +453,43 @@ class MetricsCalculator:
             MetricCalculationError: If calculation fails
         """
         try:
-            np_lengths: List[int] = []
+            stats = self._collect(doc)
+            if stats.noun_chunk_error is not None:
+                raise stats.noun_chunk_error
             
-            for chunk in doc.noun_chunks:
-                # Count tokens in the noun phrase (excluding punctuation)
-                np_length = sum(1 for token in chunk if not token.is_punct)
-                
-                if np_length > 0:
-                    np_lengths.append(np_length)
+            np_lengths = stats.np_lengths
             
             if not np_lengths:
                 logger.debug("No noun phrases found for LenNP calculation")
                 return 0.0
                 
             avg_length = sum(np_lengths) / len(np_lengths)
-            logger.debug(f"LenNP: {avg_length:.4f} (phrases: {len(np_lengths)})")
+            logger.debug("LenNP: %.4f (phrases: %d)", avg_length, len(np_lengths))
             return avg_length
             
         except Exception as e:
             raise MetricCalculationError(f"Failed to calculate LenNP: {e}")
     
+    def count_sentences(self, doc: Doc) -> int:
+        """Count the sentences of a doc.
+        
+        Uses the count gathered with the other metrics, so no extra pass
+        over doc.sents is needed.
+        
+        Args:
+            doc: spaCy Doc object
+            
+        Returns:
+            Number of sentences
+            
+        Raises:
+            MetricCalculationError: If sentence boundaries are unavailable
+        """
+        stats = self._collect(doc)
+        if stats.sentence_error is not None:
+            raise MetricCalculationError(f"Failed to count sentences: {stats.sentence_error}")
+        return stats.num_sentences
+    
     def calculate_all_metrics(self, doc: Doc, text: str) -> Dict[str, float]:
         """Calculate all metrics for the given text.
         
@@ -325,26 +505,18 @@ class MetricsCalculator:
         """
         logger.info("Calculating all metrics")
         
-        metrics = {}
-        metric_functions = [
-            ('AvrDiff', lambda: self.calculate_avrdiff(doc)),
-            ('BperA', lambda: self.calculate_bpera(doc)),
-            ('CVV1', lambda: self.calculate_cvv1(doc)),
-            ('AvrFreqRank', lambda: self.calculate_avrfreqrank(doc)),
-            ('ARI', lambda: self.calculate_ari(text)),
-            ('VperSent', lambda: self.calculate_vpersent(doc)),
-            ('POStypes', lambda: self.calculate_postypes(doc)),
-            ('LenNP', lambda: self.calculate_lennp(doc))
-        ]
-        
-        for metric_name, calc_func in metric_functions:
-            try:
-                metrics[metric_name] = calc_func()
-            except MetricCalculationError:
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error calculating {metric_name}: {e}")
-                raise MetricCalculationError(f"Failed to calculate {metric_name}: {e}")
+        # Each calculate_* method raises MetricCalculationError on failure;
+        # the doc-based ones share the counts of one _collect pass
+        metrics = {
+            'AvrDiff': self.calculate_avrdiff(doc),
+            'BperA': self.calculate_bpera(doc),
+            'CVV1': self.calculate_cvv1(doc),
+            'AvrFreqRank': self.calculate_avrfreqrank(doc),
+            'ARI': self.calculate_ari(text),
+            'VperSent': self.calculate_vpersent(doc),
+            'POStypes': self.calculate_postypes(doc),
+            'LenNP': self.calculate_lennp(doc)
+        }
         
         logger.info("All metrics calculated successfully")
         return metrics
\ No newline at end of file
@@ -2,13 +2,17 @@
 
 import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import spacy
+import srsly
 from spacy.language import Language
 from spacy.tokens import Doc
 
+from . import _jsonio
 from .cefr_mapping import CEFRMapper
 from .config import config
 from .exceptions import SpacyModelError, TextLengthError
@@ -16,6 +20,31 @@ from .logger import logger
 from .metrics import MetricsCalculator
 from .resources import ResourceManager
 
+# Components skipped when only token text, POS tags and lemmas are needed
+_PARSE_PIPES = frozenset({'parser', 'senter', 'ner'})
+
+# ResourceManagers shared by all analyzers, keyed by resolved data directory
+# (None for the bundled data), so each set of word lists is loaded once
+_resource_managers: Dict[Optional[Path], ResourceManager] = {}
+_resource_managers_lock = threading.Lock()
+
+
+def _get_resource_manager(data_dir: Optional[Path] = None) -> ResourceManager:
+    """Return the shared ResourceManager for a data directory.
+    
+    Args:
+        data_dir: Optional custom data directory for resources
+        
+    Returns:
+        ResourceManager for the directory, created on first use
+    """
+    key = Path(data_dir).resolve() if data_dir is not None else None
+    with _resource_managers_lock:
+        resources = _resource_managers.get(key)
+        if resources is None:
+            resources = _resource_managers[key] = ResourceManager(data_dir=data_dir)
+    return resources
+
 
 class PyCEFRizer:
     """Main analyzer class for PyCEFRizer (CEFR-J Level Estimator).
@@ -53,9 +82,14 @@ class PyCEFRizer:
         # Load spaCy model
         self._load_spacy_model(spacy_model)
         
+        # Recently processed texts, so analyzing the same text again (e.g.
+        # analyze() followed by get_detailed_analysis()) skips the pipeline
+        self._doc_cache: "OrderedDict[str, Doc]" = OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+        
         # Initialize components
         logger.info("Initializing PyCEFRizer components")
-        self.resources = ResourceManager(data_dir=data_dir)
+        self.resources = _get_resource_manager(data_dir)
         self.metrics_calc = MetricsCalculator(self.resources)
         self.cefr_mapper = CEFRMapper()
         
@@ -64,6 +98,10 @@ class PyCEFRizer:
     def _load_spacy_model(self, model: Optional[Union[str, Language]] = None) -> None:
         """Load the spaCy model.
         
+        Models loaded by name skip the components in config.SPACY_EXCLUDE.
+        The parser is kept because it provides sentence boundaries and
+        doc.noun_chunks for LenNP. A provided Language object is used as is.
+        
         Args:
             model: Model name or loaded model
             
@@ -79,7 +117,7 @@ class PyCEFRizer:
         
         try:
             logger.info(f"Loading spaCy model: {model_name}")
-            self.nlp = spacy.load(model_name)
+            self.nlp = spacy.load(model_name, exclude=list(config.SPACY_EXCLUDE))
             logger.info(f"Successfully loaded spaCy model: {model_name}")
         except OSError as e:
             error_msg = (
@@ -89,6 +127,109 @@ class PyCEFRizer:
             logger.error(error_msg)
             raise SpacyModelError(error_msg) from e
     
+    def to_model_bytes(self) -> bytes:
+        """Serialize the loaded spaCy pipeline, including its config.
+        
+        The result can be sent to worker processes, which rebuild the
+        pipeline with from_model_bytes() instead of loading the model
+        from disk again.
+        
+        Returns:
+            Serialized pipeline
+        """
+        model_bytes: bytes = srsly.msgpack_dumps({
+            "config": self.nlp.config.to_str(),
+            "model": self.nlp.to_bytes()
+        })
+        return model_bytes
+    
+    @classmethod
+    def from_model_bytes(cls, data: bytes, **kwargs: Any) -> "PyCEFRizer":
+        """Create an analyzer from a pipeline serialized by to_model_bytes().
+        
+        Example:
+            >>> model_bytes = PyCEFRizer().to_model_bytes()
+            >>> # In each worker process:
+            >>> analyzer = PyCEFRizer.from_model_bytes(model_bytes)
+        
+        Args:
+            data: Serialized pipeline
+            **kwargs: Other arguments passed to the constructor
+            
+        Returns:
+            Analyzer using the deserialized pipeline
+        """
+        payload = srsly.msgpack_loads(data)
+        model_config = spacy.util.load_config_from_str(payload["config"])
+        lang_cls = spacy.util.get_lang_class(model_config["nlp"]["lang"])
+        nlp = lang_cls.from_config(model_config).from_bytes(payload["model"])
+        return cls(spacy_model=nlp, **kwargs)
+    
+    def __getstate__(self) -> Dict:
+        """Drop the doc cache and its lock when pickling."""
+        state = self.__dict__.copy()
+        del state["_doc_cache"], state["_doc_cache_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        """Restore a pickled analyzer with an empty doc cache."""
+        self.__dict__.update(state)
+        self._doc_cache = OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+    
+    def _process(self, text: str) -> Doc:
+        """Run the spaCy pipeline on a text, reusing recent results.
+        
+        Keeps the config.DOC_CACHE_SIZE most recently used docs. Returning
+        the same Doc object also lets the metrics calculator reuse its
+        per-doc counts.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            Processed spaCy Doc
+        """
+        with self._doc_cache_lock:
+            doc = self._doc_cache.get(text)
+            if doc is not None:
+                self._doc_cache.move_to_end(text)
+                return doc
+        
+        doc = self.nlp(text)
+        
+        with self._doc_cache_lock:
+            self._doc_cache[text] = doc
+            while len(self._doc_cache) > config.DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)
+        return doc
+    
+    def _tag(self, text: str) -> Doc:
+        """Tag and lemmatize a text without parsing it.
+        
+        Runs the pipeline components one by one, skipping the parser,
+        which takes a large share of the processing time. Unlike
+        nlp.select_pipes(), this leaves the shared pipeline untouched, so
+        concurrent callers are unaffected. A fully processed doc from the
+        doc cache is reused when available.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            spaCy Doc with POS tags and lemmas, but no parse
+        """
+        with self._doc_cache_lock:
+            doc = self._doc_cache.get(text)
+        if doc is not None:
+            return doc
+        
+        doc = self.nlp.make_doc(text)
+        for name, component in self.nlp.pipeline:
+            if name not in _PARSE_PIPES:
+                doc = component(doc)
+        return doc
+    
     def validate_input(self, text: str) -> int:
         """Validate input text meets requirements.
         
@@ -101,11 +242,13 @@ class PyCEFRizer:
         Raises:
             TextLengthError: If text doesn't meet length requirements
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             raise TextLengthError("Input text cannot be empty")
         
-        # Count words (simple whitespace split)
-        word_count = len(text.split())
+        # Count words (simple whitespace split). Splitting stops after
+        # MAX_WORDS words, so oversized input is rejected without splitting
+        # all of it; the remainder ends up in one extra item.
+        word_count = len(text.split(maxsplit=config.MAX_WORDS))
         
         if word_count < config.MIN_WORDS:
             error_msg = (
@@ -118,12 +261,12 @@ class PyCEFRizer:
         if word_count > config.MAX_WORDS:
             error_msg = (
                 f"Text is too long. Maximum {config.MAX_WORDS} words allowed, "
-                f"but got {word_count} words."
+                f"but got more than {config.MAX_WORDS} words."
             )
             logger.error(error_msg)
             raise TextLengthError(error_msg)
             
-        logger.info(f"Input validated: {word_count} words")
+        logger.info("Input validated: %d words", word_count)
         return word_count
     
     def get_word_cefr_level(self, word: str) -> str:
@@ -146,10 +289,10 @@ class PyCEFRizer:
         level = self.resources.get_word_level(word)
         
         if level:
-            logger.info(f"Word '{word}' has CEFR level: {level}")
+            logger.info("Word '%s' has CEFR level: %s", word, level)
             return level
         else:
-            logger.info(f"Word '{word}' not found in dictionary")
+            logger.info("Word '%s' not found in dictionary", word)
             return ""
     
     def analyze(self, text: str) -> Dict[str, str]:
@@ -183,11 +326,25 @@ class PyCEFRizer:
         
         # Process text with spaCy
         logger.info("Processing text with spaCy")
-        doc = self.nlp(text)
-        logger.debug(f"Processed {len(doc)} tokens, {len(list(doc.sents))} sentences")
+        doc = self._process(text)
         
+        return self._analyze_doc(doc, text)
+    
+    def _analyze_doc(self, doc: Doc, text: str) -> Dict[str, str]:
+        """Calculate the metrics of a processed text and map them to CEFR-J.
+        
+        Args:
+            doc: spaCy Doc of the text
+            text: Original text
+            
+        Returns:
+            Dictionary with CEFR-J level and individual metric scores
+        """
         # Calculate all metrics
         metrics = self.metrics_calc.calculate_all_metrics(doc, text)
+        if logger.isEnabledFor(logging.DEBUG):
+            num_sentences = self.metrics_calc.count_sentences(doc)
+            logger.debug("Processed %d tokens, %d sentences", len(doc), num_sentences)
         
         # Map to CEFR levels
         cefr_j_level, cefr_scores = self.cefr_mapper.process_metrics(metrics)
@@ -198,21 +355,100 @@ class PyCEFRizer:
             **cefr_scores
         }
         
-        logger.info(f"Analysis complete: {cefr_j_level}")
+        logger.info("Analysis complete: %s", cefr_j_level)
         return result
     
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: int = 1
+    ) -> List[Dict[str, str]]:
+        """Analyze several texts, processing them with nlp.pipe.
+        
+        Each result equals analyze() on the same text, but the texts are
+        tagged and parsed in batches. All texts are validated before any
+        processing starts. Multiple processes only pay off for large
+        corpora of long texts; for small workloads the start-up cost of
+        the worker processes outweighs the gain, so n_process defaults to 1.
+        
+        Args:
+            texts: English texts to analyze
+            batch_size: Number of texts spaCy processes per batch.
+                       Defaults to config.SPACY_BATCH_SIZE (64)
+            n_process: Number of processes used by nlp.pipe
+            
+        Returns:
+            List of analysis results in input order
+            
+        Raises:
+            TextLengthError: If a text doesn't meet length requirements
+            MetricCalculationError: If metric calculation fails
+        """
+        texts = list(texts)
+        results: Dict[int, Dict[str, str]] = {}
+        
+        # Single words are looked up directly; the rest go through spaCy
+        parse_indices = []
+        for index, text in enumerate(texts):
+            stripped_text = text.strip()
+            if ' ' not in stripped_text and stripped_text:
+                results[index] = {"CEFR_Level": self.get_word_cefr_level(stripped_text)}
+            else:
+                self.validate_input(text)
+                parse_indices.append(index)
+        
+        logger.info("Processing %d texts with spaCy", len(parse_indices))
+        docs = self.nlp.pipe(
+            (texts[index] for index in parse_indices),
+            batch_size=batch_size or config.SPACY_BATCH_SIZE,
+            n_process=n_process
+        )
+        metrics_list = [
+            self.metrics_calc.calculate_all_metrics(doc, texts[index])
+            for index, doc in zip(parse_indices, docs)
+        ]
+        
+        # Map all texts to CEFR levels in one vectorized step
+        for index, (cefr_j_level, cefr_scores) in zip(
+            parse_indices, self.cefr_mapper.process_metrics_batch(metrics_list)
+        ):
+            results[index] = {"CEFR-J_Level": cefr_j_level, **cefr_scores}
+        
+        return [results[index] for index in range(len(texts))]
+    
+    def analyze_words(self, words: Iterable[str]) -> List[Dict[str, str]]:
+        """Look up the CEFR levels of several single words in one call.
+        
+        Equivalent to calling analyze() on each word. Single words are
+        resolved from the word dictionary alone, so no spaCy processing
+        is involved. Entries containing spaces get an empty level.
+        
+        Args:
+            words: Single English words to look up
+            
+        Returns:
+            List of {"CEFR_Level": level} dictionaries in input order
+        """
+        return [{"CEFR_Level": self.get_word_cefr_level(word)} for word in words]
+    
     def analyze_json(self, text: str, **json_kwargs) -> str:
         """Analyze text and return JSON string.
         
         Args:
             text: English text to analyze
-            **json_kwargs: Additional arguments to pass to json.dumps
+            **json_kwargs: Additional arguments to pass to json.dumps.
+                          When omitted, the faster orjson serializer is
+                          used if available.
             
         Returns:
             JSON string with results
         """
         result = self.analyze(text)
         
+        if not json_kwargs:
+            return _jsonio.dumps(result).decode('utf-8')
+        
         # Set default JSON formatting
         kwargs = {"indent": 2}
         kwargs.update(json_kwargs)
@@ -246,9 +482,9 @@ class PyCEFRizer:
         # Validate input
         self.validate_input(text)
         
-        # Process text with spaCy to get all words used
-        logger.info(f"Processing text to find unused {level} words")
-        doc = self.nlp(text)
+        # Process text with spaCy to get all words used; no parse is needed
+        logger.info("Processing text to find unused %s words", level)
+        doc = self._tag(text)
         
         # Collect all words used in the text (both original and lemma forms)
         used_words = set()
@@ -269,7 +505,7 @@ class PyCEFRizer:
                     if word not in used_words:
                         unused_words[word] = info.get('pos', 'unknown')
         
-        logger.info(f"Found {len(unused_words)} unused {level} words")
+        logger.info("Found %d unused %s words", len(unused_words), level)
         return unused_words
     
     def get_detailed_analysis(self, text: str) -> Dict[str, Union[str, Dict]]:
@@ -301,7 +537,7 @@ class PyCEFRizer:
         
         # Process text with spaCy
         logger.info("Processing text for detailed analysis")
-        doc = self.nlp(text)
+        doc = self._process(text)
         
         # Calculate all metrics
         raw_metrics = self.metrics_calc.calculate_all_metrics(doc, text)
@@ -316,7 +552,7 @@ class PyCEFRizer:
             "Raw_Metrics": {k: round(v, 4) for k, v in raw_metrics.items()},
             "Text_Statistics": {
                 "word_count": word_count,
-                "sentence_count": len(list(doc.sents)),
+                "sentence_count": self.metrics_calc.count_sentences(doc),
                 "token_count": len(doc)
             }
         }
@@ -353,12 +589,12 @@ def main():
         
         result = analyzer.analyze(sample_text)
         print("\nBasic Analysis Result:")
-        print(json.dumps(result, indent=2))
+        print(_jsonio.dumps(result).decode('utf-8'))
         
         # Get detailed analysis
         detailed = analyzer.get_detailed_analysis(sample_text)
         print("\nDetailed Analysis:")
-        print(json.dumps(detailed, indent=2))
+        print(_jsonio.dumps(detailed).decode('utf-8'))
         
     except Exception as e:
         print(f"Error: {e}")
@@ -1,18 +1,154 @@
 """Resource loading and management for PyCEFRizer."""
 
+import hashlib
 import json
 import os
+import pickle
+import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 from functools import lru_cache
 
-import spacy
-from spacy.tokens import Doc, Token
+import numpy as np
 
+from . import _jsonio
 from .config import config
 from .exceptions import ResourceLoadError
 from .logger import logger
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Token
+
+@lru_cache(maxsize=1)
+def _content_word_attrs() -> Tuple[List[Union[int, str]], np.ndarray]:
+    """Return the token attributes read for content words and the POS IDs.
+    
+    spaCy is imported on first use, so word lookups alone never load it.
+    
+    Returns:
+        Tuple of (attribute IDs for Doc.to_array, in the column order
+        POS, IS_PUNCT, IS_STOP, LOWER, LEMMA; content word POS IDs)
+    """
+    from spacy.attrs import IS_PUNCT, IS_STOP, LEMMA, LOWER, POS
+    from spacy.symbols import IDS
+    
+    pos_ids = np.array(sorted(IDS[tag] for tag in config.CONTENT_POS_TAGS), dtype=np.uint64)
+    return [POS, IS_PUNCT, IS_STOP, LOWER, LEMMA], pos_ids
+
+
+def _content_word_rows(doc: "Doc") -> np.ndarray:
+    """Return the attribute rows of the content words of a doc.
+    
+    Args:
+        doc: spaCy Doc object
+        
+    Returns:
+        Array with one (POS, IS_PUNCT, IS_STOP, LOWER, LEMMA) row per
+        content word, plus its token index as the last column
+    """
+    attr_ids, pos_ids = _content_word_attrs()
+    attrs = doc.to_array(attr_ids).reshape(len(doc), len(attr_ids))
+    mask = (attrs[:, 1] == 0) & (attrs[:, 2] == 0) & np.isin(attrs[:, 0], pos_ids)
+    indices = np.flatnonzero(mask).astype(np.uint64)
+    return np.column_stack((attrs[mask], indices))
+
+
+# Set to 1 to always parse the JSON resources instead of using pickle caches
+CACHE_DISABLE_ENV = 'PYCEFRIZER_NO_CACHE'
+
+# Overrides the directory of the pickle caches
+CACHE_DIR_ENV = 'PYCEFRIZER_CACHE_DIR'
+
+# Bump when the cached objects change, so old caches are not used
+CACHE_FORMAT_VERSION = 1
+
+
+def _cache_dir() -> Path:
+    """Return the per-user directory of the resource caches.
+    
+    Returns:
+        $PYCEFRIZER_CACHE_DIR, or pycefrizer inside $XDG_CACHE_HOME
+        (default ~/.cache)
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'pycefrizer'
+
+
+def _cache_path(source: Path, data: bytes) -> Path:
+    """Return the cache path for the given contents of a resource file.
+    
+    The name holds a hash of the contents and the cache format version, so
+    an edited or restored file never matches the cache of other contents.
+    
+    Args:
+        source: Path of the JSON resource file
+        data: Contents of the JSON resource file
+        
+    Returns:
+        Path of the pickle cache in the per-user cache directory
+    """
+    digest = hashlib.sha256(data)
+    digest.update(f"v{CACHE_FORMAT_VERSION}".encode())
+    return _cache_dir() / f"{source.stem}-{digest.hexdigest()[:32]}.pkl"
+
+
+def _read_cache(source: Path, data: bytes) -> Optional[Any]:
+    """Read the pickle cache of a resource file's contents.
+    
+    Args:
+        source: Path of the JSON resource file
+        data: Contents of the JSON resource file
+        
+    Returns:
+        Cached object, or None if there is no usable cache
+    """
+    if os.environ.get(CACHE_DISABLE_ENV) == '1':
+        return None
+    
+    cache_path = _cache_path(source, data)
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable resource cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(source: Path, data: bytes, obj: Any) -> None:
+    """Write the pickle cache of a resource file's contents.
+    
+    The cache is written to a temporary file and moved into place, so
+    concurrent readers never see a partial file. Failures (e.g. an
+    unwritable home directory) are logged and otherwise ignored.
+    
+    Args:
+        source: Path of the JSON resource file
+        data: Contents of the JSON resource file
+        obj: Parsed resource to cache
+    """
+    if os.environ.get(CACHE_DISABLE_ENV) == '1':
+        return
+    
+    cache_path = _cache_path(source, data)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write resource cache {cache_path}: {e}")
+
 
 class ResourceManager:
     """Manages loading and accessing linguistic resources for PyCEFRizer."""
@@ -30,6 +166,14 @@ class ResourceManager:
             
         self._word_lookup: Optional[Dict[str, Dict[str, str]]] = None
         self._coca_frequencies: Optional[Dict[str, int]] = None
+        # (sorted word IDs, frequency ranks) of the COCA word list
+        self._frequency_rank_index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # (word_lookup, flat word -> level dict) derived from that dictionary
+        self._word_levels: Optional[Tuple[Dict[str, Dict[str, str]], Dict[str, str]]] = None
+        # (word_lookup, flat word -> level code dict) derived from it
+        self._word_level_codes: Optional[Tuple[Dict[str, Dict[str, str]], Dict[str, int]]] = None
+        # (word_lookup, sorted word hashes, level codes) derived from it
+        self._level_code_index: Optional[Tuple[Dict, np.ndarray, np.ndarray]] = None
         
         logger.debug(f"ResourceManager initialized with data_dir: {self.data_dir}")
         
@@ -47,6 +191,99 @@ class ResourceManager:
             self._word_lookup = self._load_word_lookup()
         return self._word_lookup
     
+    @property
+    def word_levels(self) -> Dict[str, str]:
+        """Flat mapping of words to their CEFR level.
+        
+        Built from word_lookup on first use and rebuilt if word_lookup is
+        replaced, so level lookups need a single dict access.
+        
+        Returns:
+            Dictionary mapping lowercase words to CEFR levels
+            
+        Raises:
+            ResourceLoadError: If the resource file cannot be loaded
+        """
+        word_lookup = self.word_lookup
+        cached = self._word_levels
+        if cached is None or cached[0] is not word_lookup:
+            levels = {
+                word: info['CEFR'] for word, info in word_lookup.items() if 'CEFR' in info
+            }
+            self._word_levels = cached = (word_lookup, levels)
+        return cached[1]
+    
+    @property
+    def word_level_codes(self) -> Dict[str, int]:
+        """Flat mapping of words to their CEFR level code.
+        
+        Level codes are the config.CEFR_LEVELS values (1 = A1 ... 6 = C2);
+        words without a known level are left out. Built from word_lookup on
+        first use and rebuilt if word_lookup is replaced.
+        
+        Returns:
+            Dictionary mapping lowercase words to level codes
+            
+        Raises:
+            ResourceLoadError: If the resource file cannot be loaded
+        """
+        word_lookup = self.word_lookup
+        cached = self._word_level_codes
+        if cached is None or cached[0] is not word_lookup:
+            level_values = config.CEFR_LEVELS
+            codes = {
+                word: level_values[level]
+                for word, level in self.word_levels.items() if level in level_values
+            }
+            self._word_level_codes = cached = (word_lookup, codes)
+        return cached[1]
+    
+    @property
+    def level_code_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted spaCy string IDs of the words and their level codes.
+        
+        Level codes are the config.CEFR_LEVELS values (1 = A1 ... 6 = C2).
+        Built from word_lookup on first use and rebuilt if it is replaced.
+        
+        Returns:
+            Tuple of (sorted uint64 word IDs, uint8 level codes)
+            
+        Raises:
+            ResourceLoadError: If the resource file cannot be loaded
+        """
+        word_lookup = self.word_lookup
+        cached = self._level_code_index
+        if cached is None or cached[0] is not word_lookup:
+            from spacy.strings import get_string_id
+            
+            word_codes = self.word_level_codes
+            hashes = np.fromiter(
+                (get_string_id(word) for word in word_codes),
+                dtype=np.uint64, count=len(word_codes)
+            )
+            codes = np.fromiter(word_codes.values(), dtype=np.uint8, count=len(word_codes))
+            order = np.argsort(hashes)
+            self._level_code_index = cached = (word_lookup, hashes[order], codes[order])
+        return cached[1], cached[2]
+    
+    def get_level_codes(self, hashes: np.ndarray) -> np.ndarray:
+        """Look up the level codes of words given as spaCy string IDs.
+        
+        Args:
+            hashes: uint64 IDs of lowercase words, e.g. a LOWER column
+                    from Doc.to_array
+            
+        Returns:
+            Level codes (0 = not in dictionary, 1 = A1 ... 6 = C2)
+        """
+        known, known_codes = self.level_code_index
+        codes = np.zeros(len(hashes), dtype=np.intp)
+        if len(known):
+            positions = np.minimum(np.searchsorted(known, hashes), len(known) - 1)
+            found = known[positions] == hashes
+            codes[found] = known_codes[positions[found]]
+        return codes
+    
     @property
     def coca_frequencies(self) -> Dict[str, int]:
         """Lazy load COCA frequencies.
@@ -60,6 +297,32 @@ class ResourceManager:
         if self._coca_frequencies is None:
             self._coca_frequencies = self._load_coca_frequencies()
         return self._coca_frequencies
+    
+    @property
+    def frequency_rank_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted spaCy string IDs of the COCA words and their ranks.
+        
+        For vectorized lookups of a Doc's LOWER IDs with np.searchsorted;
+        single words are looked up in coca_frequencies.
+        
+        Returns:
+            Tuple of (sorted uint64 word IDs, uint32 frequency ranks)
+            
+        Raises:
+            ResourceLoadError: If the resource file cannot be loaded
+        """
+        if self._frequency_rank_index is None:
+            from spacy.strings import get_string_id
+            
+            frequencies = self.coca_frequencies
+            hashes = np.fromiter(
+                (get_string_id(word) for word in frequencies),
+                dtype=np.uint64, count=len(frequencies)
+            )
+            ranks = np.fromiter(frequencies.values(), dtype=np.uint32, count=len(frequencies))
+            order = np.argsort(hashes)
+            self._frequency_rank_index = (hashes[order], ranks[order])
+        return self._frequency_rank_index
         
     def _load_word_lookup(self) -> Dict[str, Dict[str, str]]:
         """Load the word lookup dictionary with CEFR levels.
@@ -72,16 +335,41 @@ class ResourceManager:
         """
         filepath = self.data_dir / 'word_lookup.json'
         
+        try:
+            data = filepath.read_bytes()
+        except FileNotFoundError:
+            raise ResourceLoadError(f"Word lookup file not found: {filepath}")
+        except OSError as e:
+            raise ResourceLoadError(f"Error loading word lookup: {e}")
+        
+        # A pickle of the processed dictionary loads about twice as fast as
+        # parsing the JSON; it is keyed on a hash of the JSON contents
+        word_lookup = _read_cache(filepath, data)
+        if word_lookup is not None:
+            logger.info(f"Loaded {len(word_lookup)} words from word lookup cache")
+            return word_lookup
+        
         try:
             logger.info(f"Loading word lookup from {filepath}")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                word_lookup = json.load(f)
+            word_lookup = _jsonio.loads(data)
+            
+            # Intern the words and every string inside the entries. Levels, POS
+            # tags and field names repeat across all entries, and base forms
+            # repeat the key of their headword, so each distinct string is
+            # stored once. The pickle cache keeps this sharing.
+            intern = sys.intern
+            word_lookup = {
+                intern(word): {
+                    intern(field): intern(value) if isinstance(value, str) else value
+                    for field, value in info.items()
+                }
+                for word, info in word_lookup.items()
+            }
             
             logger.info(f"Loaded {len(word_lookup)} words from word lookup")
+            _write_cache(filepath, data, word_lookup)
             return word_lookup
             
-        except FileNotFoundError:
-            raise ResourceLoadError(f"Word lookup file not found: {filepath}")
         except json.JSONDecodeError as e:
             raise ResourceLoadError(f"Invalid JSON in word lookup file: {e}")
         except Exception as e:
@@ -90,6 +378,9 @@ class ResourceManager:
     def _load_coca_frequencies(self) -> Dict[str, int]:
         """Load COCA frequency rankings.
         
+        The file must already use lowercase words (prepare_resources.py
+        normalizes it), so the parsed dictionary is used as is.
+        
         Returns:
             Dict mapping words to their frequency ranks
             
@@ -100,17 +391,10 @@ class ResourceManager:
         
         try:
             logger.info(f"Loading COCA frequencies from {filepath}")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                frequencies = json.load(f)
+            frequencies: Dict[str, int] = _jsonio.load_file(filepath)
             
-            # Convert all words to lowercase for consistent lookup
-            frequencies_lower = {
-                word.lower(): rank 
-                for word, rank in frequencies.items()
-            }
-            
-            logger.info(f"Loaded {len(frequencies_lower)} frequency rankings")
-            return frequencies_lower
+            logger.info(f"Loaded {len(frequencies)} frequency rankings")
+            return frequencies
             
         except FileNotFoundError:
             raise ResourceLoadError(f"COCA frequencies file not found: {filepath}")
@@ -119,7 +403,6 @@ class ResourceManager:
         except Exception as e:
             raise ResourceLoadError(f"Error loading COCA frequencies: {e}")
     
-    @lru_cache(maxsize=10000)
     def get_word_level(self, word: str) -> Optional[str]:
         """Get the CEFR level of a word.
         
@@ -129,15 +412,8 @@ class ResourceManager:
         Returns:
             CEFR level (A1, A2, B1, B2, C1, C2) or None if not found
         """
-        word_lower = word.lower()
-        
-        # Check if word exists in lookup
-        if word_lower in self.word_lookup:
-            return self.word_lookup[word_lower].get('CEFR')
-            
-        return None
+        return self.word_levels.get(word.lower())
     
-    @lru_cache(maxsize=10000)
     def get_word_difficulty(self, word: str) -> float:
         """Get numeric difficulty score for a word.
         
@@ -147,14 +423,8 @@ class ResourceManager:
         Returns:
             Difficulty score (1=A1, 2=A2, 3=B1, 4=B2, 5=C1, 6=C2) or 0 if not found
         """
-        level = self.get_word_level(word)
-        
-        if level is None:
-            return 0.0
-            
-        return float(config.CEFR_LEVELS.get(level, 0))
+        return float(self.word_level_codes.get(word.lower(), 0))
     
-    @lru_cache(maxsize=10000)
     def get_word_frequency_rank(self, word: str) -> int:
         """Get COCA frequency rank for a word.
         
@@ -164,13 +434,13 @@ class ResourceManager:
         Returns:
             Frequency rank (1-10000) or 10000 if not found
         """
-        word_lower = word.lower()
-        return self.coca_frequencies.get(word_lower, config.DEFAULT_FREQUENCY_RANK)
+        return self.coca_frequencies.get(word.lower(), config.DEFAULT_FREQUENCY_RANK)
     
-    def get_content_words(self, doc: Doc) -> List[Token]:
+    def get_content_words(self, doc: "Doc") -> List["Token"]:
         """Extract content words from a spaCy doc.
         
-        Content words are nouns, verbs, adjectives, and adverbs.
+        Content words are nouns, verbs, adjectives, and adverbs. Only POS
+        tags and stop word flags are read, so the doc needs no parse.
         
         Args:
             doc: spaCy Doc object
@@ -178,20 +448,11 @@ class ResourceManager:
         Returns:
             List of content word tokens
         """
-        content_words = []
-        
-        for token in doc:
-            # Skip punctuation and stop words
-            if token.is_punct or token.is_stop:
-                continue
-                
-            # Check if it's a content word based on POS tag
-            if token.pos_ in config.CONTENT_POS_TAGS:
-                content_words.append(token)
-                
-        return content_words
+        # Skip punctuation and stop words and keep the content POS tags,
+        # filtering all tokens at once on their integer attributes
+        return [doc[index] for index in _content_word_rows(doc)[:, 5].tolist()]
     
-    def get_content_words_by_level(self, doc: Doc) -> Dict[str, List[str]]:
+    def get_content_words_by_level(self, doc: "Doc") -> Dict[str, List[str]]:
         """Group content words by their CEFR level.
         
         Args:
@@ -200,33 +461,39 @@ class ResourceManager:
         Returns:
             Dict mapping CEFR levels to lists of words at that level
         """
-        content_words = self.get_content_words(doc)
+        strings = doc.vocab.strings
+        word_codes = self.word_level_codes
+        level_values = config.CEFR_LEVELS
+        
+        # Levels of all token texts in one vectorized lookup
+        rows = _content_word_rows(doc)
+        codes = self.get_level_codes(rows[:, 3])
+        
+        # Lowercase and look up each distinct lemma once rather than once per token
+        lemma_ids, lemma_index = np.unique(rows[:, 4], return_inverse=True)
+        lemmas = np.array(
+            [strings[lemma_id].lower() for lemma_id in lemma_ids.tolist()], dtype=object
+        )
+        lemma_codes = np.array(
+            [word_codes.get(lemma, 0) for lemma in lemmas], dtype=np.intp
+        )
+        
+        # If the token text is not in the dictionary, use the lemma's level
+        codes = np.where(codes > 0, codes, lemma_codes[lemma_index])
+        words = lemmas[lemma_index]
+        
+        # Fill each bucket with one masked selection; code 0 means not in the dictionary
         words_by_level: Dict[str, List[str]] = {
-            'A1': [], 'A2': [], 'B1': [], 'B2': [], 'C1': [], 'C2': [], 'unknown': []
+            level: words[codes == value].tolist() for level, value in level_values.items()
         }
+        words_by_level['unknown'] = words[codes == 0].tolist()
         
-        for token in content_words:
-            # Try the token text first, then lemma
-            word_text = token.text.lower()
-            word_lemma = token.lemma_.lower()
-            
-            # First try exact match with token text
-            level = self.get_word_level(word_text)
-            
-            # If not found, try with lemma
-            if not level:
-                level = self.get_word_level(word_lemma)
-            
-            if level:
-                words_by_level[level].append(word_lemma)
-            else:
-                words_by_level['unknown'].append(word_lemma)
-                
         return words_by_level
     
     def clear_cache(self) -> None:
-        """Clear the LRU cache for word lookups."""
-        self.get_word_level.cache_clear()
-        self.get_word_difficulty.cache_clear()
-        self.get_word_frequency_rank.cache_clear()
+        """Clear cached word lookups.
+        
+        Word lookups are no longer memoized, so this is a no-op kept for
+        backward compatibility.
+        """
         logger.debug("Cleared resource cache")
\ No newline at end of file
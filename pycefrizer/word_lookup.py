@@ -1,10 +1,37 @@
 """Convenience functions for word CEFR level lookup."""
 
-from typing import Optional
-from .pycefrizer import PyCEFRizer
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from .config import config
+
+if TYPE_CHECKING:
+    from .pycefrizer import PyCEFRizer
 
 # Global analyzer instance for convenience functions
-_analyzer: Optional[PyCEFRizer] = None
+_analyzer: Optional["PyCEFRizer"] = None
+_analyzer_lock = threading.Lock()
+
+
+def _get_analyzer() -> "PyCEFRizer":
+    """Return the global analyzer, creating it on first use.
+    
+    Creation is guarded by a lock, so concurrent first calls from several
+    threads load the spaCy model and resources only once.
+    
+    Returns:
+        The shared PyCEFRizer instance
+    """
+    global _analyzer
+    analyzer = _analyzer
+    if analyzer is None:
+        with _analyzer_lock:
+            analyzer = _analyzer
+            if analyzer is None:
+                # Imported here so that importing this module does not load spaCy
+                from .pycefrizer import PyCEFRizer
+                analyzer = _analyzer = PyCEFRizer()
+    return analyzer
 
 
 def get_word_level(word: str) -> str:
@@ -28,11 +55,7 @@ def get_word_level(word: str) -> str:
         >>> get_word_level("xyzabc")
         ''
     """
-    global _analyzer
-    if _analyzer is None:
-        _analyzer = PyCEFRizer()
-    
-    return _analyzer.get_word_cefr_level(word)
+    return _get_analyzer().get_word_cefr_level(word)
 
 
 def check_word_level(word: str, target_level: str) -> bool:
@@ -52,15 +75,6 @@ def check_word_level(word: str, target_level: str) -> bool:
         >>> check_word_level("paradigm", "B1")  # paradigm is C1
         False
     """
-    level = get_word_level(word)
-    if not level:
-        return False
-    
-    level_order = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
-    
-    try:
-        word_index = level_order.index(level)
-        target_index = level_order.index(target_level.upper())
-        return word_index <= target_index
-    except ValueError:
-        return False
\ No newline at end of file
+    word_value = config.CEFR_LEVELS.get(get_word_level(word))
+    target_value = config.CEFR_LEVELS.get(target_level.upper())
+    return word_value is not None and target_value is not None and word_value <= target_value
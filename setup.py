@@ -36,11 +36,18 @@ setup(
         "spacy>=3.7.2",
         "textstat>=0.7.4",
         "nltk>=3.8",
+        "numpy>=1.21",
+        "srsly>=2.4.3",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.10",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
+            "pytest-xdist>=3.5",
+            "pytest-benchmark>=4.0",
             "black>=23.0",
             "ruff>=0.1.0",
         ],
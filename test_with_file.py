@@ -13,14 +13,15 @@ def main():
     with open('testdata.txt', 'r', encoding='utf-8') as f:
         text = f.read()
     
-    # Count words
-    word_count = len(text.split())
-    print(f"Analyzing testdata.txt ({word_count} words)...")
-    print("="*60)
-    
     try:
-        # Get basic analysis
-        result = analyzer.analyze(text)
+        # Run the detailed analysis once; it also reports the word count
+        # and contains the basic result (level and metric scores)
+        detailed = analyzer.get_detailed_analysis(text)
+        result = {"CEFR-J_Level": detailed["CEFR-J_Level"], **detailed["CEFR_Scores"]}
+        
+        word_count = detailed["Text_Statistics"]["word_count"]
+        print(f"Analyzing testdata.txt ({word_count} words)...")
+        print("="*60)
         
         print("\nPyCEFRizer Analysis Result:")
         print(f"CEFR-J Level: {result['CEFR-J_Level']}")
@@ -30,9 +31,6 @@ def main():
             if metric != 'CEFR-J_Level':
                 print(f"  {metric}: {score}")
         
-        # Get detailed analysis
-        detailed = analyzer.get_detailed_analysis(text)
-        
         print("\nRaw Metric Values:")
         for metric, value in detailed['Raw_Metrics'].items():
             print(f"  {metric}: {value}")
@@ -0,0 +1,95 @@
+"""Shared fixtures for the PyCEFRizer test suite."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pycefrizer import PyCEFRizer
+from pycefrizer.exceptions import SpacyModelError
+from pycefrizer.resources import CACHE_DIR_ENV
+
+
+@pytest.fixture(scope="session", autouse=True)
+def resource_cache_dir(tmp_path_factory):
+    """Keep the resource caches written by the tests out of the user's cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_DIR_ENV, str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def sample_texts():
+    """Sample texts for testing (shared, so tests must not modify it)."""
+    return {
+        'short': "This is too short.",  # Less than 10 words
+        'valid': ("word " * 50).rstrip(),  # 50 words
+        'long': ("word " * 11000).rstrip(),  # More than 10000 words
+        'empty': "",
+        'whitespace': "   \n\t  ",
+        'simple': """
+            The cat sat on the mat. The dog ran in the park.
+            Birds fly in the sky. Fish swim in water.
+            Trees grow in the forest. Flowers bloom in spring.
+            Children play with toys. Adults work at jobs.
+            The sun shines bright. The moon glows at night.
+        """,  # Simple A1-level text
+        'complex': """
+            The paradigmatic shift in contemporary epistemological discourse
+            necessitates a comprehensive reconsideration of ontological premises.
+            Quantum mechanics elucidates the probabilistic nature of subatomic
+            phenomena, challenging deterministic frameworks. The emergence of
+            artificial intelligence precipitates philosophical inquiries regarding
+            consciousness and cognition. Interdisciplinary synthesis facilitates
+            nuanced understanding of complex systems. Phenomenological analysis
+            reveals intricate relationships between subjective experience and
+            objective reality.
+        """  # Complex C1-C2 level text
+    }
+
+
+@pytest.fixture(scope="session")
+def base_analyzer():
+    """PyCEFRizer created once per session with spacy.load patched out."""
+    with patch('pycefrizer.pycefrizer.spacy.load', return_value=Mock()):
+        return PyCEFRizer()
+
+
+@pytest.fixture
+def analyzer(base_analyzer):
+    """The session analyzer with a fresh mock pipeline and empty doc cache.
+    
+    Tests configure the pipeline through analyzer.nlp (e.g. its
+    return_value or pipe attribute).
+    """
+    base_analyzer.nlp = Mock()
+    base_analyzer._doc_cache.clear()
+    return base_analyzer
+
+
+@pytest.fixture
+def bare_analyzer():
+    """PyCEFRizer created without __init__, for tests of pure-Python checks.
+    
+    Only nlp is set (to None); tests set any other attribute they read.
+    """
+    bare = PyCEFRizer.__new__(PyCEFRizer)
+    bare.nlp = None
+    return bare
+
+
+@pytest.fixture(scope="session")
+def real_analyzer():
+    """PyCEFRizer with the real spaCy model, loaded once per session.
+    
+    Tests using it are skipped when the model is not installed.
+    """
+    try:
+        analyzer = PyCEFRizer()
+    except SpacyModelError as e:
+        pytest.skip(str(e))
+    
+    # Warm up the pipeline and the word lookups
+    analyzer.nlp("Warm up the pipeline.")
+    _ = analyzer.resources.word_level_codes
+    _ = analyzer.resources.coca_frequencies
+    return analyzer
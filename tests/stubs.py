@@ -0,0 +1,38 @@
+"""Lightweight stand-ins for spaCy objects used by the tests."""
+
+# Shared sentence sequences; the code under test only counts sentences
+ONE_SENT = (None,)
+FIVE_SENTS = (None,) * 5
+
+
+class StubDoc:
+    """Minimal spaCy Doc stand-in: iterable tokens, len() and sents."""
+
+    __slots__ = ('tokens', 'sents')
+
+    def __init__(self, tokens=(), sents=()):
+        self.tokens = tuple(tokens)
+        self.sents = tuple(sents)
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __len__(self):
+        return len(self.tokens)
+
+
+class StubNLP:
+    """Minimal spaCy pipeline stand-in that returns the same doc for any text.
+
+    It has no components, so both full processing and tagging yield the doc.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.pipeline = []
+
+    def __call__(self, text):
+        return self.doc
+
+    def make_doc(self, text):
+        return self.doc
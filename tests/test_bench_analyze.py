@@ -0,0 +1,32 @@
+"""Benchmarks of PyCEFRizer.analyze on the real spaCy pipeline.
+
+Run with ``pytest tests/test_bench_analyze.py -m slow --benchmark-only``.
+They are skipped when pytest-benchmark or the spaCy model is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _bench_analyze(benchmark, analyzer, text):
+    """Benchmark analyze() on a text, bypassing the processed doc cache."""
+    result = benchmark.pedantic(
+        analyzer.analyze, args=(text,), setup=analyzer._doc_cache.clear,
+        rounds=20, warmup_rounds=1
+    )
+    assert 'CEFR-J_Level' in result
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="analyze")
+def test_bench_simple(benchmark, real_analyzer, sample_texts):
+    """Benchmark the analysis of the simple sample text."""
+    _bench_analyze(benchmark, real_analyzer, sample_texts['simple'])
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark(group="analyze")
+def test_bench_complex(benchmark, real_analyzer, sample_texts):
+    """Benchmark the analysis of the complex sample text."""
+    _bench_analyze(benchmark, real_analyzer, sample_texts['complex'])
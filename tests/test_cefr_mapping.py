@@ -1,7 +1,33 @@
 """Tests for CEFR mapping module."""
 
+import random
+
 import pytest
 from pycefrizer.cefr_mapping import CEFRMapper
+from pycefrizer.config import config
+
+
+def _metrics_for_scores(scores):
+    """Raw metric values whose rounded CEFR scores are the given scores."""
+    return {
+        name: (score - intercept) / slope
+        for score, (name, (slope, intercept))
+        in zip(scores, config.REGRESSION_COEFFICIENTS.items())
+    }
+
+
+def _boundary_scores(rng, cut):
+    """Eight two-decimal CEFR scores whose middle-six mean equals a cut."""
+    cents = round(cut * 600)
+    while True:
+        middle = [rng.randint(-300, 650) for _ in range(5)]
+        middle.append(cents - sum(middle))
+        if -300 <= middle[-1] <= 650:
+            break
+    middle.sort()
+    scores = [rng.randint(-1000, middle[0]), *middle, rng.randint(middle[-1], 700)]
+    rng.shuffle(scores)
+    return [cents / 100 for cents in scores]
 
 
 class TestCEFRMapper:
@@ -110,4 +136,41 @@ class TestCEFRMapper:
         assert len(cefr_scores) == 8
         
         # Check all scores are strings
-        assert all(isinstance(score, str) for score in cefr_scores.values())
\ No newline at end of file
+        assert all(isinstance(score, str) for score in cefr_scores.values())
+    
+    def test_process_metrics_batch(self):
+        """Test that batch processing matches per-text processing."""
+        metrics_list = [
+            {
+                'AvrDiff': 1.0 + i * 0.37,
+                'BperA': 0.1 * i,
+                'CVV1': 2.0 + i,
+                'AvrFreqRank': 500 + 250 * i,
+                'ARI': 4.0 + i,
+                'VperSent': 1.5 + 0.2 * i,
+                'POStypes': 7.0 + 0.5 * i,
+                'LenNP': 2.0 + 0.3 * i
+            }
+            for i in range(6)
+        ]
+        
+        expected = [self.mapper.process_metrics(metrics) for metrics in metrics_list]
+        assert self.mapper.process_metrics_batch(metrics_list) == expected
+        assert self.mapper.process_metrics_batch([]) == []
+        
+        with pytest.raises(ValueError):
+            self.mapper.process_metrics_batch([{'Unknown': 1.0, 'CVV1': 2.0, 'ARI': 3.0}])
+    
+    def test_process_metrics_batch_at_boundaries(self):
+        """Test that batch and scalar levels agree when a score hits a boundary."""
+        rng = random.Random(0)
+        score_rows = [[-9.35, -6.61, -0.96, -0.61, 2.3, 3.92, 7.0, 7.0]]
+        for cut, _ in config.CEFR_J_BOUNDARIES[:-1]:
+            score_rows.extend(_boundary_scores(rng, cut) for _ in range(20))
+        metrics_list = [_metrics_for_scores(scores) for scores in score_rows]
+        
+        for metrics, scores in zip(metrics_list, score_rows):
+            assert list(self.mapper.calculate_cefr_scores(metrics).values()) == scores
+        
+        expected = [self.mapper.process_metrics(metrics) for metrics in metrics_list]
+        assert self.mapper.process_metrics_batch(metrics_list) == expected
@@ -1,18 +1,40 @@
 """Tests for configuration module."""
 
+from unittest.mock import Mock
+
 import pytest
-from pycefrizer.config import config
+
+from pycefrizer.config import SPACY_BATCH_SIZE_ENV, Config, config
+from pycefrizer.logger import logger
 
 
 def test_config_values():
     """Test that configuration values are correctly set."""
     assert config.MIN_WORDS == 10
     assert config.MAX_WORDS == 10000
+    assert config.MAX_INPUT_BYTES == 1_000_000
     assert config.SPACY_MODEL == 'en_core_web_sm'
+    assert config.SPACY_BATCH_SIZE == 64
     assert len(config.CONTENT_POS_TAGS) == 4
     assert 'NOUN' in config.CONTENT_POS_TAGS
     
 
+@pytest.mark.parametrize("value, expected, warned", [
+    ("16", 16, False),
+    ("abc", 64, True),
+    ("0", 64, True),
+    ("-5", 64, True),
+])
+def test_spacy_batch_size_env(monkeypatch, value, expected, warned):
+    """Test that invalid batch sizes from the environment fall back to 64."""
+    mock_warning = Mock()
+    monkeypatch.setattr(logger, 'warning', mock_warning)
+    monkeypatch.setenv(SPACY_BATCH_SIZE_ENV, value)
+    
+    assert Config().SPACY_BATCH_SIZE == expected
+    assert mock_warning.called is warned
+
+
 def test_cefr_levels():
     """Test CEFR level mappings."""
     assert config.CEFR_LEVELS['A1'] == 1
@@ -43,4 +65,12 @@ def test_cefr_j_boundaries():
     prev_boundary = -float('inf')
     for boundary, level in config.CEFR_J_BOUNDARIES:
         assert boundary > prev_boundary
-        prev_boundary = boundary
\ No newline at end of file
+        prev_boundary = boundary
+
+def test_mappings_are_read_only():
+    """Test that lookup tables cannot be mutated through the frozen config."""
+    with pytest.raises(TypeError):
+        config.REGRESSION_COEFFICIENTS['CVV1'] = (0.0, 0.0)
+    with pytest.raises(TypeError):
+        config.CEFR_LEVELS['A1'] = 0
+    assert isinstance(config.CEFR_J_BOUNDARIES, tuple)
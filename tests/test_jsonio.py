@@ -0,0 +1,47 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+from pycefrizer import _jsonio
+
+
+SAMPLE = {"CEFR-J_Level": "B1.1", "CVV1_CEFR": "2.11", "Count": 3}
+
+
+def test_dumps_returns_bytes():
+    """Test that dumps returns valid UTF-8 JSON bytes."""
+    output = _jsonio.dumps(SAMPLE)
+    assert isinstance(output, bytes)
+    assert json.loads(output) == SAMPLE
+
+
+def test_dumps_pretty_and_compact():
+    """Test indented and compact output."""
+    assert b"\n  " in _jsonio.dumps(SAMPLE)
+    assert b"\n" not in _jsonio.dumps(SAMPLE, pretty=False)
+
+
+def test_dumps_stdlib_fallback(monkeypatch):
+    """Test that the stdlib fallback matches the orjson output."""
+    expected = _jsonio.dumps(SAMPLE)
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    assert _jsonio.dumps(SAMPLE) == expected
+    assert json.loads(_jsonio.dumps(SAMPLE, pretty=False)) == SAMPLE
+
+
+def test_loads_round_trip(monkeypatch):
+    """Test that loads accepts bytes and str with and without orjson."""
+    data = _jsonio.dumps(SAMPLE)
+    assert _jsonio.loads(data) == SAMPLE
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    assert _jsonio.loads(data) == SAMPLE
+    assert _jsonio.loads(data.decode()) == SAMPLE
+
+
+def test_load_file(tmp_path, monkeypatch):
+    """Test that small and memory-mapped files load the same."""
+    path = tmp_path / "sample.json"
+    path.write_bytes(_jsonio.dumps(SAMPLE))
+    assert _jsonio.load_file(path) == SAMPLE
+    monkeypatch.setattr(_jsonio, "MMAP_THRESHOLD", 0)
+    assert _jsonio.load_file(path) == SAMPLE
@@ -0,0 +1,29 @@
+"""Tests for logging configuration."""
+
+import logging
+
+from pycefrizer.logger import setup_logger
+
+
+def test_setup_logger_reuses_handler():
+    """Test that repeated calls with the same settings keep the handler."""
+    logger = setup_logger("pycefrizer.test", level=logging.WARNING)
+    handler = logger.handlers[0]
+    
+    assert setup_logger("pycefrizer.test", level=logging.WARNING) is logger
+    assert logger.handlers == [handler]
+
+
+def test_setup_logger_reconfigures_on_change():
+    """Test that a new level or format replaces the handler."""
+    logger = setup_logger("pycefrizer.test2", level=logging.WARNING)
+    handler = logger.handlers[0]
+    
+    setup_logger("pycefrizer.test2", level=logging.DEBUG)
+    assert logger.handlers[0] is not handler
+    assert logger.handlers[0].level == logging.DEBUG
+    assert len(logger.handlers) == 1
+    
+    handler = logger.handlers[0]
+    setup_logger("pycefrizer.test2", level=logging.DEBUG, format_string="%(message)s")
+    assert logger.handlers[0] is not handler
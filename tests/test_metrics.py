@@ -0,0 +1,88 @@
+"""Tests for metric calculation module."""
+
+import math
+
+import pytest
+import spacy
+from spacy.tokens import Doc
+from unittest.mock import Mock
+
+from pycefrizer.exceptions import MetricCalculationError
+from pycefrizer.metrics import MetricsCalculator
+
+
+LEVELS = {'cat': 'A1', 'run': 'A1', 'quickly': 'B1', 'happy': 'A2'}
+RANKS = {'the': 1, 'cat': 500, 'runs': 800, 'quickly': 2000, 'she': 30, 'is': 5, 'happy': 700}
+
+
+class TestMetricsCalculator:
+    """Test suite for MetricsCalculator class."""
+    
+    @pytest.fixture
+    def vocab(self):
+        """Vocab of a blank English pipeline (provides stop words)."""
+        return spacy.blank('en').vocab
+    
+    @pytest.fixture
+    def doc(self, vocab):
+        """Two parsed sentences: 'The cat runs quickly. She is happy.'"""
+        return Doc(
+            vocab,
+            words=['The', 'cat', 'runs', 'quickly', '.', 'She', 'is', 'happy', '.'],
+            pos=['DET', 'NOUN', 'VERB', 'ADV', 'PUNCT', 'PRON', 'VERB', 'ADJ', 'PUNCT'],
+            lemmas=['the', 'cat', 'run', 'quickly', '.', 'she', 'be', 'happy', '.'],
+            heads=[1, 2, 2, 2, 2, 6, 6, 6, 6],
+            deps=['det', 'nsubj', 'ROOT', 'advmod', 'punct', 'nsubj', 'ROOT', 'acomp', 'punct']
+        )
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.resources = Mock()
+        self.resources.get_word_level.side_effect = LEVELS.get
+        self.resources.get_word_frequency_rank.side_effect = lambda w: RANKS.get(w, 10000)
+        self.calc = MetricsCalculator(self.resources)
+    
+    def test_doc_metrics(self, doc):
+        """Test each doc-based metric on a hand-built doc."""
+        assert self.calc.calculate_cvv1(doc) == pytest.approx(1 / math.sqrt(2))
+        assert self.calc.calculate_bpera(doc) == pytest.approx(1 / 3)
+        assert self.calc.calculate_avrdiff(doc) == pytest.approx(1.75)
+        assert self.calc.calculate_avrfreqrank(doc) == pytest.approx(134.0)
+        assert self.calc.calculate_vpersent(doc) == pytest.approx(1.0)
+        assert self.calc.calculate_postypes(doc) == pytest.approx(3.5)
+        assert self.calc.calculate_lennp(doc) == pytest.approx(1.5)
+        assert self.calc.count_sentences(doc) == 2
+    
+    def test_single_traversal(self, doc, vocab):
+        """Test that all metrics for a doc share one traversal."""
+        metrics = self.calc.calculate_all_metrics(doc, doc.text)
+        
+        assert len(metrics) == 8
+        # One frequency lookup per distinct lowercased token
+        assert self.resources.get_word_frequency_rank.call_count == 8
+        
+        # A different doc is traversed again
+        self.calc.calculate_cvv1(Doc(vocab, words=['Cats', 'run']))
+        assert self.resources.get_word_frequency_rank.call_count == 10
+    
+    def test_word_lookups_are_memoized(self, doc, vocab):
+        """Test that repeated words are looked up in the resources only once."""
+        self.calc.calculate_cvv1(doc)
+        self.calc.calculate_cvv1(Doc(vocab, words=['The', 'cat'], pos=['DET', 'NOUN']))
+        assert self.resources.get_word_frequency_rank.call_count == 8
+        
+        self.calc.clear_cache()
+        self.calc.calculate_cvv1(doc)
+        assert self.resources.get_word_frequency_rank.call_count == 16
+    
+    def test_unparsed_doc(self, vocab):
+        """Test that only parse-dependent metrics fail without a parse."""
+        doc = Doc(vocab, words=['The', 'cat', 'runs'], pos=['DET', 'NOUN', 'VERB'])
+        
+        assert self.calc.calculate_cvv1(doc) == pytest.approx(1 / math.sqrt(2))
+        for calculate in (self.calc.calculate_postypes,
+                          self.calc.calculate_vpersent,
+                          self.calc.calculate_lennp,
+                          self.calc.count_sentences):
+            with pytest.raises(MetricCalculationError):
+                calculate(doc)
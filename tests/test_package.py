@@ -0,0 +1,38 @@
+"""Tests for the package namespace."""
+
+import subprocess
+import sys
+
+import pycefrizer
+
+
+def test_all_names_resolve():
+    """Test that every name in __all__ is importable from the package."""
+    for name in pycefrizer.__all__:
+        assert getattr(pycefrizer, name) is not None
+    assert len(set(pycefrizer.__all__)) == len(pycefrizer.__all__)
+
+
+def test_star_import():
+    """Test that a star import exposes exactly the public names."""
+    namespace = {}
+    exec("from pycefrizer import *", namespace)
+    namespace.pop("__builtins__")
+    assert set(namespace) == set(pycefrizer.__all__)
+
+
+def test_config_and_logger_are_objects():
+    """Test that config and logger are not shadowed by their submodules."""
+    import pycefrizer.config  # noqa: F401
+    import pycefrizer.logger  # noqa: F401
+    assert pycefrizer.config.MIN_WORDS == 10
+    assert pycefrizer.logger.name == "pycefrizer"
+
+
+def test_import_does_not_load_spacy():
+    """Test that importing the package does not import spaCy."""
+    code = "import sys, pycefrizer; print('spacy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
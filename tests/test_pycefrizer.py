@@ -1,46 +1,94 @@
 """Tests for main PyCEFRizer class."""
 
-import json
+import pickle
 import pytest
-from unittest.mock import Mock, patch
+import spacy
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
-from pycefrizer import PyCEFRizer
+from pycefrizer import PyCEFRizer, _jsonio
+from pycefrizer.metrics import MetricsCalculator
+from pycefrizer.resources import ResourceManager
 from pycefrizer.exceptions import TextLengthError, SpacyModelError
 
+from .stubs import FIVE_SENTS, ONE_SENT, StubDoc, StubNLP
+
+
+# Raw metric values returned by the patched metrics calculator
+METRICS = {
+    'AvrDiff': 2.0,
+    'BperA': 0.3,
+    'CVV1': 3.0,
+    'AvrFreqRank': 1000,
+    'ARI': 8.0,
+    'VperSent': 2.0,
+    'POStypes': 8.0,
+    'LenNP': 3.0
+}
+
+# Word lookup for the get_unused_words tests
+WORD_LOOKUP = {
+    'the': {'base_form': 'the', 'pos': 'determiner', 'CEFR': 'A1'},
+    'cat': {'base_form': 'cat', 'pos': 'noun', 'CEFR': 'A1'},
+    'dog': {'base_form': 'dog', 'pos': 'noun', 'CEFR': 'A1'},
+    'house': {'base_form': 'house', 'pos': 'noun', 'CEFR': 'A1'},
+    'run': {'base_form': 'run', 'pos': 'verb', 'CEFR': 'A1'},
+    'running': {'base_form': 'run', 'pos': 'verb', 'CEFR': 'A1'},
+    'walk': {'base_form': 'walk', 'pos': 'verb', 'CEFR': 'A1'},
+    'jump': {'base_form': 'jump', 'pos': 'verb', 'CEFR': 'A1'},
+    'sat': {'base_form': 'sit', 'pos': 'verb', 'CEFR': 'A2'},
+    'sit': {'base_form': 'sit', 'pos': 'verb', 'CEFR': 'A2'},
+    'on': {'base_form': 'on', 'pos': 'preposition', 'CEFR': 'A1'},
+    'mat': {'base_form': 'mat', 'pos': 'noun', 'CEFR': 'A2'},
+    'cloak': {'base_form': 'cloak', 'pos': 'noun', 'CEFR': 'C1'},
+    'exterior': {'base_form': 'exterior', 'pos': 'noun', 'CEFR': 'C1'},
+}
+
+# The A1 words of WORD_LOOKUP used in "The cat dog" only
+USED_WORD_LOOKUP = {word: WORD_LOOKUP[word] for word in ('the', 'cat', 'dog')}
+
+
+# Text passed to get_unused_words; only its length matters, since the stub
+# pipeline returns the test's tokens for any text
+UNUSED_WORDS_TEXT = "The cat sat on the mat while the dog ran home."
+
+
+def _token(text, lemma=None):
+    """Stub word token whose lemma defaults to its text."""
+    return SimpleNamespace(text=text, lemma_=lemma or text, is_punct=False, is_space=False)
+
 
 class TestPyCEFRizer:
     """Test suite for PyCEFRizer class."""
     
     @pytest.fixture
-    def sample_texts(self):
-        """Sample texts for testing."""
-        return {
-            'short': "This is too short.",  # Less than 10 words
-            'valid': " ".join(["word"] * 50),  # 50 words
-            'long': " ".join(["word"] * 11000),  # More than 10000 words
-            'empty': "",
-            'whitespace': "   \n\t  ",
-            'simple': """
-                The cat sat on the mat. The dog ran in the park.
-                Birds fly in the sky. Fish swim in water.
-                Trees grow in the forest. Flowers bloom in spring.
-                Children play with toys. Adults work at jobs.
-                The sun shines bright. The moon glows at night.
-            """,  # Simple A1-level text
-            'complex': """
-                The paradigmatic shift in contemporary epistemological discourse
-                necessitates a comprehensive reconsideration of ontological premises.
-                Quantum mechanics elucidates the probabilistic nature of subatomic
-                phenomena, challenging deterministic frameworks. The emergence of
-                artificial intelligence precipitates philosophical inquiries regarding
-                consciousness and cognition. Interdisciplinary synthesis facilitates
-                nuanced understanding of complex systems. Phenomenological analysis
-                reveals intricate relationships between subjective experience and
-                objective reality.
-            """  # Complex C1-C2 level text
-        }
+    def mock_spacy_load(self, monkeypatch):
+        """Mock installed in place of spacy.load."""
+        mock_load = Mock(return_value=Mock())
+        monkeypatch.setattr('pycefrizer.pycefrizer.spacy.load', mock_load)
+        return mock_load
+    
+    @pytest.fixture
+    def mock_metrics(self, monkeypatch):
+        """Mock installed in place of calculate_all_metrics, returning METRICS."""
+        mock_calculate = Mock(return_value=METRICS)
+        monkeypatch.setattr(MetricsCalculator, 'calculate_all_metrics', mock_calculate)
+        return mock_calculate
+    
+    @pytest.fixture
+    def mocked_analyzer(self, analyzer, mock_metrics):
+        """The analyzer on a stub 50-token, 5-sentence doc with mocked metrics.
+        
+        Returns:
+            Tuple of the analyzer and a function replacing the raw metrics
+        """
+        analyzer.nlp = StubNLP(StubDoc((None,) * 50, FIVE_SENTS))
+        
+        def set_metrics(metrics):
+            mock_metrics.return_value = metrics
+        
+        return analyzer, set_metrics
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
     def test_initialization(self, mock_spacy_load):
         """Test PyCEFRizer initialization."""
         mock_nlp = Mock()
@@ -49,9 +97,8 @@ class TestPyCEFRizer:
         analyzer = PyCEFRizer()
         
         assert analyzer.nlp == mock_nlp
-        mock_spacy_load.assert_called_once_with('en_core_web_sm')
+        mock_spacy_load.assert_called_once_with('en_core_web_sm', exclude=['ner'])
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
     def test_initialization_with_custom_model(self, mock_spacy_load):
         """Test initialization with custom spaCy model."""
         mock_nlp = Mock()
@@ -59,9 +106,8 @@ class TestPyCEFRizer:
         
         analyzer = PyCEFRizer(spacy_model='en_core_web_lg')
         
-        mock_spacy_load.assert_called_once_with('en_core_web_lg')
+        mock_spacy_load.assert_called_once_with('en_core_web_lg', exclude=['ner'])
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
     def test_initialization_model_not_found(self, mock_spacy_load):
         """Test initialization when spaCy model is not found."""
         mock_spacy_load.side_effect = OSError("Model not found")
@@ -72,308 +118,211 @@ class TestPyCEFRizer:
         assert "not found" in str(exc_info.value)
         assert "python -m spacy download" in str(exc_info.value)
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_validate_input(self, mock_spacy_load, sample_texts):
-        """Test input validation."""
-        mock_spacy_load.return_value = Mock()
-        analyzer = PyCEFRizer()
-        
-        # Test valid input
-        word_count = analyzer.validate_input(sample_texts['valid'])
-        assert word_count == 50
-        
-        # Test empty input
-        with pytest.raises(TextLengthError) as exc_info:
-            analyzer.validate_input(sample_texts['empty'])
-        assert "cannot be empty" in str(exc_info.value)
-        
-        # Test whitespace only
-        with pytest.raises(TextLengthError) as exc_info:
-            analyzer.validate_input(sample_texts['whitespace'])
-        assert "cannot be empty" in str(exc_info.value)
-        
-        # Test too short
+    def test_resources_are_shared(self, mock_spacy_load, tmp_path):
+        """Test that analyzers for the same data directory share resources."""
+        first = PyCEFRizer()
+        assert PyCEFRizer().resources is first.resources
+        
+        custom = PyCEFRizer(data_dir=tmp_path)
+        assert custom.resources is not first.resources
+        assert PyCEFRizer(data_dir=str(tmp_path)).resources is custom.resources
+    
+    def test_tag_skips_parser(self):
+        """Test that tagging runs every component except the parser."""
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer', name='parser')
+        analyzer = PyCEFRizer(spacy_model=nlp)
+        
+        text = "One sentence. Two sentences."
+        assert not analyzer._tag(text).has_annotation('SENT_START')
+        
+        # A fully processed doc from the cache is reused
+        doc = analyzer._process(text)
+        assert analyzer._tag(text) is doc
+    
+    def test_model_bytes_round_trip(self):
+        """Test rebuilding an analyzer from a serialized pipeline."""
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        analyzer = PyCEFRizer(spacy_model=nlp)
+        
+        restored = PyCEFRizer.from_model_bytes(analyzer.to_model_bytes())
+        assert restored.nlp is not nlp
+        assert restored.nlp.pipe_names == ['sentencizer']
+        assert len(list(restored.nlp("One sentence. Two sentences.").sents)) == 2
+        
+        # Analyzers can be pickled for worker processes
+        unpickled = pickle.loads(pickle.dumps(analyzer))
+        assert unpickled.nlp.pipe_names == ['sentencizer']
+        assert unpickled._process("A short text.") is unpickled._process("A short text.")
+    
+    def test_validate_input(self, analyzer, sample_texts):
+        """Test input validation of valid texts."""
+        assert analyzer.validate_input(sample_texts['valid']) == 50
+        
+        # Test the upper boundary
+        assert analyzer.validate_input("word " * 9999 + "word\n") == 10000
+        with pytest.raises(TextLengthError):
+            analyzer.validate_input(("word " * 10001).rstrip())
+    
+    @pytest.mark.parametrize("key, messages", [
+        ('empty', ["cannot be empty"]),
+        ('whitespace', ["cannot be empty"]),
+        ('short', ["too short", "10 words required"]),
+        ('long', ["too long", "10000 words allowed"]),
+    ])
+    def test_validate_input_errors(self, analyzer, sample_texts, key, messages):
+        """Test that empty, too short and too long texts are rejected."""
         with pytest.raises(TextLengthError) as exc_info:
-            analyzer.validate_input(sample_texts['short'])
-        assert "too short" in str(exc_info.value)
-        assert "10 words required" in str(exc_info.value)
+            analyzer.validate_input(sample_texts[key])
         
-        # Test too long
-        with pytest.raises(TextLengthError) as exc_info:
-            analyzer.validate_input(sample_texts['long'])
-        assert "too long" in str(exc_info.value)
-        assert "10000 words allowed" in str(exc_info.value)
+        for message in messages:
+            assert message in str(exc_info.value)
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_analyze_output_structure(self, mock_spacy_load, sample_texts):
+    def test_analyze_output_structure(self, mocked_analyzer, sample_texts):
         """Test analyze method output structure."""
-        # Mock spaCy components
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=50)
-        mock_doc.sents = [Mock() for _ in range(5)]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
-        
-        with patch('pycefrizer.metrics.MetricsCalculator.calculate_all_metrics') as mock_metrics:
-            mock_metrics.return_value = {
-                'AvrDiff': 2.0,
-                'BperA': 0.3,
-                'CVV1': 3.0,
-                'AvrFreqRank': 1000,
-                'ARI': 8.0,
-                'VperSent': 2.0,
-                'POStypes': 8.0,
-                'LenNP': 3.0
-            }
-            
-            analyzer = PyCEFRizer()
-            result = analyzer.analyze(sample_texts['simple'])
-            
-            # Check result structure
-            assert isinstance(result, dict)
-            assert 'CEFR-J_Level' in result
-            assert isinstance(result['CEFR-J_Level'], str)
-            
-            # Check metric scores
-            expected_metrics = [
-                'AvrDiff_CEFR', 'BperA_CEFR', 'CVV1_CEFR', 
-                'AvrFreqRank_CEFR', 'ARI_CEFR', 'VperSent_CEFR',
-                'POStypes_CEFR', 'LenNP_CEFR'
-            ]
-            for metric in expected_metrics:
-                assert metric in result
-                assert isinstance(result[metric], str)
+        analyzer, _ = mocked_analyzer
+        result = analyzer.analyze(sample_texts['simple'])
+        
+        # Check result structure
+        assert isinstance(result, dict)
+        assert 'CEFR-J_Level' in result
+        assert isinstance(result['CEFR-J_Level'], str)
+        
+        # Check metric scores
+        expected_metrics = [
+            'AvrDiff_CEFR', 'BperA_CEFR', 'CVV1_CEFR', 
+            'AvrFreqRank_CEFR', 'ARI_CEFR', 'VperSent_CEFR',
+            'POStypes_CEFR', 'LenNP_CEFR'
+        ]
+        for metric in expected_metrics:
+            assert metric in result
+            assert isinstance(result[metric], str)
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_analyze_json(self, mock_spacy_load, sample_texts):
+    def test_analyze_json(self, mocked_analyzer, sample_texts):
         """Test JSON output method."""
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=50)
-        mock_doc.sents = [Mock() for _ in range(5)]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
+        analyzer, _ = mocked_analyzer
+        json_result = analyzer.analyze_json(sample_texts['simple'])
         
-        with patch('pycefrizer.metrics.MetricsCalculator.calculate_all_metrics') as mock_metrics:
-            mock_metrics.return_value = {
-                'AvrDiff': 2.0,
-                'BperA': 0.3,
-                'CVV1': 3.0,
-                'AvrFreqRank': 1000,
-                'ARI': 8.0,
-                'VperSent': 2.0,
-                'POStypes': 8.0,
-                'LenNP': 3.0
-            }
-            
-            analyzer = PyCEFRizer()
-            json_result = analyzer.analyze_json(sample_texts['simple'])
-            
-            # Check it's valid JSON
-            parsed = json.loads(json_result)
-            assert isinstance(parsed, dict)
-            assert 'CEFR-J_Level' in parsed
+        # Check it's valid JSON
+        parsed = _jsonio.loads(json_result)
+        assert isinstance(parsed, dict)
+        assert 'CEFR-J_Level' in parsed
+    
+    def test_analyze_batch(self, analyzer, mock_metrics, monkeypatch, sample_texts):
+        """Test batch analysis through nlp.pipe."""
+        mock_nlp = analyzer.nlp
+        mock_nlp.pipe = Mock(side_effect=lambda texts, **kwargs: [Mock() for _ in texts])
+        
+        monkeypatch.setattr(analyzer, 'get_word_cefr_level', lambda word: 'A1')
+        results = analyzer.analyze_batch(
+            [sample_texts['simple'], 'cat', sample_texts['complex']]
+        )
+        
+        assert len(results) == 3
+        assert 'CEFR-J_Level' in results[0]
+        assert results[1] == {"CEFR_Level": "A1"}
+        assert 'CEFR-J_Level' in results[2]
+        assert mock_nlp.pipe.call_args.kwargs == {'batch_size': 64, 'n_process': 1}
+        assert not mock_nlp.called
+        
+        # Texts are validated before any of them is processed
+        mock_nlp.pipe.reset_mock()
+        with pytest.raises(TextLengthError):
+            analyzer.analyze_batch([sample_texts['simple'], sample_texts['short']])
+        assert not mock_nlp.pipe.called
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_detailed_analysis(self, mock_spacy_load, sample_texts):
+    def test_get_detailed_analysis(self, mocked_analyzer, monkeypatch, sample_texts):
         """Test detailed analysis method."""
-        mock_doc = Mock()
-        mock_doc.__len__ = Mock(return_value=50)
-        mock_doc.sents = [Mock() for _ in range(5)]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
-        
-        with patch('pycefrizer.metrics.MetricsCalculator.calculate_all_metrics') as mock_metrics:
-            mock_metrics.return_value = {
-                'AvrDiff': 2.12345,
-                'BperA': 0.36789,
-                'CVV1': 3.14159,
-                'AvrFreqRank': 1234.5678,
-                'ARI': 8.91011,
-                'VperSent': 2.22222,
-                'POStypes': 8.33333,
-                'LenNP': 3.44444
-            }
-            
-            analyzer = PyCEFRizer()
-            result = analyzer.get_detailed_analysis(sample_texts['simple'])
-            
-            # Check result structure
-            assert isinstance(result, dict)
-            assert 'CEFR-J_Level' in result
-            assert 'CEFR_Scores' in result
-            assert 'Raw_Metrics' in result
-            assert 'Text_Statistics' in result
-            
-            # Check raw metrics are rounded to 4 decimal places
-            for value in result['Raw_Metrics'].values():
-                assert len(str(value).split('.')[-1]) <= 4
-            
-            # Check text statistics
-            stats = result['Text_Statistics']
-            assert 'word_count' in stats
-            assert 'sentence_count' in stats
-            assert 'token_count' in stats
+        analyzer, set_metrics = mocked_analyzer
+        set_metrics({
+            'AvrDiff': 2.12345,
+            'BperA': 0.36789,
+            'CVV1': 3.14159,
+            'AvrFreqRank': 1234.5678,
+            'ARI': 8.91011,
+            'VperSent': 2.22222,
+            'POStypes': 8.33333,
+            'LenNP': 3.44444
+        })
+        
+        monkeypatch.setattr(analyzer.metrics_calc, 'count_sentences', lambda doc: 5)
+        result = analyzer.get_detailed_analysis(sample_texts['simple'])
+        
+        # Check result structure
+        assert isinstance(result, dict)
+        assert 'CEFR-J_Level' in result
+        assert 'CEFR_Scores' in result
+        assert 'Raw_Metrics' in result
+        assert 'Text_Statistics' in result
+        
+        # Check raw metrics are rounded to 4 decimal places
+        for value in result['Raw_Metrics'].values():
+            assert round(value, 4) == value
+        
+        # Check text statistics
+        stats = result['Text_Statistics']
+        assert 'word_count' in stats
+        assert stats['sentence_count'] == 5
+        assert 'token_count' in stats
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_unused_words(self, mock_spacy_load, sample_texts):
-        """Test get_unused_words method."""
-        # Create mock tokens for the text
-        mock_tokens = []
-        
-        # Words used in the text
-        for word in ['the', 'cat', 'sat', 'on', 'mat']:
-            token = Mock()
-            token.text = word
-            token.lemma_ = word
-            token.is_punct = False
-            token.is_space = False
-            mock_tokens.append(token)
-        
-        # Create mock doc
-        mock_doc = Mock()
-        mock_doc.__iter__ = Mock(return_value=iter(mock_tokens))
-        mock_doc.__len__ = Mock(return_value=len(mock_tokens))
-        mock_doc.sents = [Mock()]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
-        
-        # Mock the word_lookup dictionary
-        mock_word_lookup = {
-            'the': {'base_form': 'the', 'pos': 'determiner', 'CEFR': 'A1'},
-            'cat': {'base_form': 'cat', 'pos': 'noun', 'CEFR': 'A1'},
-            'dog': {'base_form': 'dog', 'pos': 'noun', 'CEFR': 'A1'},
-            'house': {'base_form': 'house', 'pos': 'noun', 'CEFR': 'A1'},
-            'run': {'base_form': 'run', 'pos': 'verb', 'CEFR': 'A1'},
-            'running': {'base_form': 'run', 'pos': 'verb', 'CEFR': 'A1'},
-            'sat': {'base_form': 'sit', 'pos': 'verb', 'CEFR': 'A2'},
-            'sit': {'base_form': 'sit', 'pos': 'verb', 'CEFR': 'A2'},
-            'on': {'base_form': 'on', 'pos': 'preposition', 'CEFR': 'A1'},
-            'mat': {'base_form': 'mat', 'pos': 'noun', 'CEFR': 'A2'},
-            'cloak': {'base_form': 'cloak', 'pos': 'noun', 'CEFR': 'C1'},
-            'exterior': {'base_form': 'exterior', 'pos': 'noun', 'CEFR': 'C1'},
-        }
-        
-        with patch('pycefrizer.resources.ResourceManager.word_lookup', mock_word_lookup):
-            analyzer = PyCEFRizer()
-            
-            # Test getting unused A1 words
-            unused_a1 = analyzer.get_unused_words("A1", "The cat sat on the mat.")
-            
-            # Should return A1 words not used in text (dog, house, run)
-            assert 'dog' in unused_a1
-            assert 'house' in unused_a1
-            assert 'run' in unused_a1
-            assert unused_a1['dog'] == 'noun'
-            assert unused_a1['house'] == 'noun'
-            assert unused_a1['run'] == 'verb'
-            
-            # Should not include used words or non-A1 words
-            assert 'the' not in unused_a1
-            assert 'cat' not in unused_a1
-            assert 'cloak' not in unused_a1
-            
-            # Test getting unused C1 words
-            unused_c1 = analyzer.get_unused_words("C1", "The cat sat on the mat.")
-            assert 'cloak' in unused_c1
-            assert 'exterior' in unused_c1
-            assert unused_c1['cloak'] == 'noun'
-            assert unused_c1['exterior'] == 'noun'
+    def test_processed_docs_are_reused(self, analyzer, mock_metrics, monkeypatch, sample_texts):
+        """Test that analyzing the same text twice runs spaCy once."""
+        mock_nlp = analyzer.nlp
+        mock_nlp.side_effect = lambda text: MagicMock()
+        
+        analyzer.analyze(sample_texts['simple'])
+        monkeypatch.setattr(analyzer.metrics_calc, 'count_sentences', lambda doc: 5)
+        analyzer.get_detailed_analysis(sample_texts['simple'])
+        assert mock_nlp.call_count == 1
+        assert mock_metrics.call_args_list[0] == mock_metrics.call_args_list[1]
+        
+        analyzer.analyze(sample_texts['complex'])
+        assert mock_nlp.call_count == 2
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_unused_words_empty_result(self, mock_spacy_load):
-        """Test get_unused_words when all words of a level are used."""
-        # Create mock tokens - use all A1 words
-        mock_tokens = []
-        for word in ['the', 'cat', 'dog']:
-            token = Mock()
-            token.text = word
-            token.lemma_ = word
-            token.is_punct = False
-            token.is_space = False
-            mock_tokens.append(token)
-        
-        mock_doc = Mock()
-        mock_doc.__iter__ = Mock(return_value=iter(mock_tokens))
-        mock_doc.__len__ = Mock(return_value=len(mock_tokens))
-        mock_doc.sents = [Mock()]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
-        
-        # Mock word lookup with only the words used in text
-        mock_word_lookup = {
-            'the': {'base_form': 'the', 'pos': 'determiner', 'CEFR': 'A1'},
-            'cat': {'base_form': 'cat', 'pos': 'noun', 'CEFR': 'A1'},
-            'dog': {'base_form': 'dog', 'pos': 'noun', 'CEFR': 'A1'},
-        }
-        
-        with patch('pycefrizer.resources.ResourceManager.word_lookup', mock_word_lookup):
-            analyzer = PyCEFRizer()
-            unused_words = analyzer.get_unused_words("A1", "The cat dog")
-            
-            # Should return empty dict when all A1 words are used
-            assert unused_words == {}
-    
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_unused_words_with_lemma_lookup(self, mock_spacy_load):
-        """Test that lemma forms are also checked when identifying used words."""
-        # Create mock tokens with different text and lemma forms
-        mock_tokens = []
-        
-        # Word with different text and lemma
-        token1 = Mock()
-        token1.text = 'running'
-        token1.lemma_ = 'run'  # Lemma form
-        token1.is_punct = False
-        token1.is_space = False
-        mock_tokens.append(token1)
-        
-        # Another inflected form
-        token2 = Mock()
-        token2.text = 'jumped'
-        token2.lemma_ = 'jump'
-        token2.is_punct = False
-        token2.is_space = False
-        mock_tokens.append(token2)
-        
-        mock_doc = Mock()
-        mock_doc.__iter__ = Mock(return_value=iter(mock_tokens))
-        mock_doc.__len__ = Mock(return_value=len(mock_tokens))
-        mock_doc.sents = [Mock()]
-        
-        mock_nlp = Mock(return_value=mock_doc)
-        mock_spacy_load.return_value = mock_nlp
-        
-        # Mock word lookup
-        mock_word_lookup = {
-            'run': {'base_form': 'run', 'pos': 'verb', 'CEFR': 'A1'},
-            'walk': {'base_form': 'walk', 'pos': 'verb', 'CEFR': 'A1'},
-            'jump': {'base_form': 'jump', 'pos': 'verb', 'CEFR': 'A1'},
-        }
-        
-        with patch('pycefrizer.resources.ResourceManager.word_lookup', mock_word_lookup):
-            analyzer = PyCEFRizer()
-            unused_words = analyzer.get_unused_words("A1", "running jumped")
-            
-            # 'walk' should be unused, but 'run' and 'jump' are used via lemmas
-            assert 'walk' in unused_words
-            assert unused_words['walk'] == 'verb'
-            assert 'run' not in unused_words  # Used via 'running'
-            assert 'jump' not in unused_words  # Used via 'jumped'
+    @pytest.mark.parametrize("tokens, word_lookup, level, text, present, absent", [
+        pytest.param(
+            ('the', 'cat', 'sat', 'on', 'mat'), WORD_LOOKUP, "A1", UNUSED_WORDS_TEXT,
+            {'dog': 'noun', 'house': 'noun', 'run': 'verb'}, {'the', 'cat', 'cloak'},
+            id="basic"
+        ),
+        pytest.param(
+            ('the', 'cat', 'sat', 'on', 'mat'), WORD_LOOKUP, "C1", UNUSED_WORDS_TEXT,
+            {'cloak': 'noun', 'exterior': 'noun'}, {'dog'},
+            id="basic_c1"
+        ),
+        # Every word of the lookup is used, so none may be returned
+        pytest.param(
+            ('the', 'cat', 'dog'), USED_WORD_LOOKUP, "A1", UNUSED_WORDS_TEXT,
+            {}, set(USED_WORD_LOOKUP),
+            id="empty"
+        ),
+        # 'run' and 'jump' are used via the lemmas of 'running' and 'jumped'
+        pytest.param(
+            (('running', 'run'), ('jumped', 'jump')), WORD_LOOKUP, "A1", UNUSED_WORDS_TEXT,
+            {'walk': 'verb'}, {'run', 'jump'},
+            id="lemma"
+        ),
+    ])
+    def test_get_unused_words(self, analyzer, monkeypatch, tokens, word_lookup, level, text,
+                              present, absent):
+        """Test that get_unused_words returns the level's words not used in the text."""
+        mock_tokens = tuple(
+            _token(*token) if isinstance(token, tuple) else _token(token) for token in tokens
+        )
+        analyzer.nlp = StubNLP(StubDoc(mock_tokens, ONE_SENT))
+        monkeypatch.setattr(ResourceManager, 'word_lookup', word_lookup)
+        
+        unused_words = analyzer.get_unused_words(level, text)
+        
+        for word, pos in present.items():
+            assert unused_words[word] == pos
+        assert not absent & unused_words.keys()
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_unused_words_invalid_level(self, mock_spacy_load):
+    def test_get_unused_words_invalid_level(self, bare_analyzer):
         """Test that invalid CEFR level raises ValueError."""
-        mock_spacy_load.return_value = Mock()
-        
-        analyzer = PyCEFRizer()
-        
         with pytest.raises(ValueError) as exc_info:
-            analyzer.get_unused_words("X1", "Some text here")
+            bare_analyzer.get_unused_words("X1", "Some text here")
         
         assert "Invalid CEFR level: X1" in str(exc_info.value)
         assert "Must be one of" in str(exc_info.value)
\ No newline at end of file
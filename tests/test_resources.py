@@ -0,0 +1,151 @@
+"""Tests for resource loading module."""
+
+import json
+import os
+import pickle
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import spacy
+from spacy.tokens import Doc
+
+from pycefrizer.resources import CACHE_DIR_ENV, CACHE_DISABLE_ENV, ResourceManager
+
+
+WORD_LOOKUP = {
+    "cat": {"base_form": "cat", "pos": "noun", "CEFR": "A1"},
+    "cats": {"base_form": "cat", "pos": "noun", "CEFR": "A1"},
+}
+
+
+class TestResourceCache:
+    """Test suite for the pickle cache of parsed resources."""
+    
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Empty per-user cache directory."""
+        monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+        return tmp_path / "cache"
+    
+    @pytest.fixture
+    def data_dir(self, tmp_path, cache_dir):
+        """Data directory containing a small word lookup file."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "word_lookup.json").write_text(json.dumps(WORD_LOOKUP), encoding="utf-8")
+        return data_dir
+    
+    def test_cache_is_written_and_used(self, data_dir, cache_dir):
+        """Test that a second load reads the cache instead of the JSON."""
+        assert ResourceManager(data_dir).word_lookup == WORD_LOOKUP
+        assert len(list(cache_dir.glob("word_lookup-*.pkl"))) == 1
+        assert list(data_dir.iterdir()) == [data_dir / "word_lookup.json"]
+        
+        with patch("pycefrizer.resources._jsonio.loads") as mock_loads:
+            assert ResourceManager(data_dir).word_lookup == WORD_LOOKUP
+        assert not mock_loads.called
+    
+    def test_cache_is_keyed_on_contents(self, data_dir):
+        """Test that a changed JSON file is parsed even if it is older."""
+        _ = ResourceManager(data_dir).word_lookup
+        
+        updated = {"dog": {"base_form": "dog", "pos": "noun", "CEFR": "A1"}}
+        json_path = data_dir / "word_lookup.json"
+        json_path.write_text(json.dumps(updated), encoding="utf-8")
+        os.utime(json_path, (0, 0))
+        
+        assert ResourceManager(data_dir).word_lookup == updated
+    
+    def test_pickle_in_data_dir_is_not_loaded(self, data_dir):
+        """Test that a pickle next to the JSON file is never read."""
+        (data_dir / "word_lookup.pkl").write_bytes(pickle.dumps({"evil": {}}))
+        assert ResourceManager(data_dir).word_lookup == WORD_LOOKUP
+    
+    def test_cache_can_be_disabled(self, data_dir, cache_dir, monkeypatch):
+        """Test that the environment variable turns the cache off."""
+        monkeypatch.setenv(CACHE_DISABLE_ENV, "1")
+        assert ResourceManager(data_dir).word_lookup == WORD_LOOKUP
+        assert not cache_dir.exists()
+    
+    def test_corrupt_cache_is_ignored(self, data_dir, cache_dir):
+        """Test that an unreadable cache falls back to the JSON file."""
+        _ = ResourceManager(data_dir).word_lookup
+        for cache_path in cache_dir.glob("word_lookup-*.pkl"):
+            cache_path.write_bytes(b"not a pickle")
+        
+        assert ResourceManager(data_dir).word_lookup == WORD_LOOKUP
+
+
+class TestContentWords:
+    """Test suite for content word extraction."""
+    
+    @pytest.fixture
+    def doc(self):
+        """Doc with content words, stop words and punctuation."""
+        return Doc(
+            spacy.blank("en").vocab,
+            words=["The", "Cats", "run", "very", "quickly", "."],
+            pos=["DET", "NOUN", "VERB", "ADV", "ADV", "PUNCT"],
+            lemmas=["the", "cat", "run", "very", "quickly", "."]
+        )
+    
+    @pytest.fixture
+    def resources(self, tmp_path, monkeypatch):
+        """ResourceManager over a small word lookup file."""
+        monkeypatch.setenv(CACHE_DISABLE_ENV, "1")
+        lookup = dict(WORD_LOOKUP, run={"base_form": "run", "pos": "verb", "CEFR": "A2"})
+        (tmp_path / "word_lookup.json").write_text(json.dumps(lookup), encoding="utf-8")
+        return ResourceManager(tmp_path)
+    
+    def test_get_content_words(self, resources, doc):
+        """Test that stop words and punctuation are skipped."""
+        words = [token.text for token in resources.get_content_words(doc)]
+        assert words == ["Cats", "run", "quickly"]
+    
+    def test_word_level_codes(self, resources):
+        """Test level codes and the difficulty scores derived from them."""
+        assert resources.word_level_codes == {"cat": 1, "cats": 1, "run": 2}
+        assert resources.get_word_difficulty("Run") == 2.0
+        assert resources.get_word_difficulty("quickly") == 0.0
+    
+    def test_get_content_words_by_level(self, resources, doc):
+        """Test grouping by level with the lemma as fallback."""
+        assert resources.get_content_words_by_level(doc) == {
+            "A1": ["cat"], "A2": ["run"], "B1": [], "B2": [], "C1": [], "C2": [],
+            "unknown": ["quickly"]
+        }
+    
+    def test_get_content_words_by_level_symbol_words(self, resources):
+        """Test words whose spaCy string ID is a symbol rather than a hash."""
+        lookup = dict(resources.word_lookup, number={"base_form": "number", "pos": "noun", "CEFR": "A1"})
+        resources._word_lookup = lookup
+        doc = Doc(spacy.blank("en").vocab, words=["Number"], pos=["NOUN"], lemmas=["number"])
+        assert resources.get_content_words_by_level(doc)["A1"] == ["number"]
+
+
+def test_get_word_frequency_rank(tmp_path):
+    """Test case-insensitive rank lookups with the default for unknown words."""
+    frequencies = {"the": 1, "number": 2, "house": 3, "zygote": 70000}
+    (tmp_path / "coca_frequencies.json").write_text(json.dumps(frequencies), encoding="utf-8")
+    resources = ResourceManager(tmp_path)
+    
+    assert resources.get_word_frequency_rank("the") == 1
+    assert resources.get_word_frequency_rank("Number") == 2
+    assert resources.get_word_frequency_rank("HOUSE") == 3
+    assert resources.get_word_frequency_rank("zygote") == 70000
+    assert resources.get_word_frequency_rank("zebra") == 10000
+
+
+def test_frequency_rank_index(tmp_path):
+    """Test that the sorted ID arrays look up the ranks of a Doc's words."""
+    frequencies = {"the": 1, "number": 2, "house": 3, "zygote": 70000}
+    (tmp_path / "coca_frequencies.json").write_text(json.dumps(frequencies), encoding="utf-8")
+    known, ranks = ResourceManager(tmp_path).frequency_rank_index
+    
+    doc = Doc(spacy.blank("en").vocab, words=["The", "number", "zygote", "zebra"])
+    word_ids = doc.to_array("LOWER")
+    positions = np.searchsorted(known, word_ids).clip(max=len(known) - 1)
+    found = known[positions] == word_ids
+    assert np.where(found, ranks[positions], 10000).tolist() == [1, 2, 70000, 10000]
@@ -1,58 +1,53 @@
 """Tests for word CEFR level lookup functionality."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-from pycefrizer import PyCEFRizer, get_word_level, check_word_level
-from pycefrizer.word_lookup import _analyzer
+from pycefrizer import get_word_level, check_word_level, word_lookup
+
+
+# CEFR levels of the words known to the mocked resources
+WORD_LEVELS = {
+    'cat': 'A1',
+    'beautiful': 'B1',
+    'paradigm': 'C1',
+    'xyz123': None
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_global_analyzer():
+    """Start and finish every test without the module-level analyzer."""
+    word_lookup._analyzer = None
+    yield
+    word_lookup._analyzer = None
 
 
 class TestWordLookup:
     """Test suite for word lookup functionality."""
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_get_word_cefr_level(self, mock_spacy_load):
+    @pytest.mark.parametrize("word, expected", [
+        # Existing words
+        ('cat', 'A1'),
+        ('beautiful', 'B1'),
+        ('paradigm', 'C1'),
+        # Non-existent word
+        ('xyz123', ''),
+        # Empty input
+        ('', ''),
+        # Multi-word input (should return empty)
+        ('hello world', ''),
+    ])
+    def test_get_word_cefr_level(self, bare_analyzer, word, expected):
         """Test getting CEFR level for single words."""
-        mock_spacy_load.return_value = Mock()
-        
-        with patch('pycefrizer.resources.ResourceManager.get_word_level') as mock_get_level:
-            # Set up mock responses
-            mock_get_level.side_effect = lambda w: {
-                'cat': 'A1',
-                'beautiful': 'B1',
-                'paradigm': 'C1',
-                'xyz123': None
-            }.get(w)
-            
-            analyzer = PyCEFRizer()
-            
-            # Test existing words
-            assert analyzer.get_word_cefr_level('cat') == 'A1'
-            assert analyzer.get_word_cefr_level('beautiful') == 'B1'
-            assert analyzer.get_word_cefr_level('paradigm') == 'C1'
-            
-            # Test non-existent word
-            assert analyzer.get_word_cefr_level('xyz123') == ''
-            
-            # Test empty input
-            assert analyzer.get_word_cefr_level('') == ''
-            
-            # Test multi-word input (should return empty)
-            assert analyzer.get_word_cefr_level('hello world') == ''
+        bare_analyzer.resources = SimpleNamespace(get_word_level=WORD_LEVELS.get)
+        assert bare_analyzer.get_word_cefr_level(word) == expected
     
-    @patch('pycefrizer.pycefrizer.spacy.load')
-    def test_analyze_single_word(self, mock_spacy_load):
+    def test_analyze_single_word(self, analyzer):
         """Test analyze method with single words."""
-        mock_spacy_load.return_value = Mock()
-        
         with patch('pycefrizer.resources.ResourceManager.get_word_level') as mock_get_level:
-            mock_get_level.side_effect = lambda w: {
-                'cat': 'A1',
-                'beautiful': 'B1',
-                'xyz123': None
-            }.get(w)
-            
-            analyzer = PyCEFRizer()
+            mock_get_level.side_effect = WORD_LEVELS.get
             
             # Test single word returns only CEFR_Level
             result = analyzer.analyze('cat')
@@ -65,22 +60,29 @@ class TestWordLookup:
             result = analyzer.analyze('xyz123')
             assert result == {'CEFR_Level': ''}
     
+    def test_analyze_words(self, analyzer):
+        """Test batch lookup of single words."""
+        with patch('pycefrizer.resources.ResourceManager.get_word_level') as mock_get_level:
+            mock_get_level.side_effect = WORD_LEVELS.get
+            
+            results = analyzer.analyze_words(['cat', 'Beautiful', 'xyz123', 'two words'])
+            
+            assert results == [
+                {'CEFR_Level': 'A1'},
+                {'CEFR_Level': 'B1'},
+                {'CEFR_Level': ''},
+                {'CEFR_Level': ''},
+            ]
+            assert results[0] == analyzer.analyze('cat')
+            analyzer.nlp.assert_not_called()
+    
     @patch('pycefrizer.pycefrizer.spacy.load')
     def test_convenience_functions(self, mock_spacy_load):
         """Test convenience functions for word lookup."""
         mock_spacy_load.return_value = Mock()
         
-        # Reset global analyzer
-        import pycefrizer.word_lookup
-        pycefrizer.word_lookup._analyzer = None
-        
         with patch('pycefrizer.resources.ResourceManager.get_word_level') as mock_get_level:
-            mock_get_level.side_effect = lambda w: {
-                'cat': 'A1',
-                'beautiful': 'B1',
-                'paradigm': 'C1',
-                'xyz123': None
-            }.get(w)
+            mock_get_level.side_effect = WORD_LEVELS.get
             
             # Test get_word_level
             assert get_word_level('cat') == 'A1'
@@ -88,34 +90,59 @@ class TestWordLookup:
             assert get_word_level('xyz123') == ''
             
             # Check that analyzer was created
-            assert pycefrizer.word_lookup._analyzer is not None
+            assert word_lookup._analyzer is not None
+    
+    def test_analyze_shares_the_word_lookup_analyzer(self):
+        """Test that pycefrizer.analyze and get_word_level load one analyzer."""
+        import pycefrizer
+        
+        with patch('pycefrizer.pycefrizer.PyCEFRizer', side_effect=lambda: Mock()) as mock_cls:
+            pycefrizer.analyze("Some text to analyze.")
+            get_word_level('cat')
+        
+        assert mock_cls.call_count == 1
+        word_lookup._analyzer.analyze.assert_called_once_with("Some text to analyze.")
+    
+    def test_analyzer_created_once_across_threads(self):
+        """Test that concurrent first calls share one analyzer."""
+        import threading
+        
+        barrier = threading.Barrier(4)
+        results = []
+        with patch('pycefrizer.pycefrizer.PyCEFRizer', side_effect=lambda: Mock()) as mock_cls:
+            def lookup():
+                barrier.wait()
+                results.append(word_lookup._get_analyzer())
+            
+            threads = [threading.Thread(target=lookup) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert mock_cls.call_count == 1
+        assert all(result is results[0] for result in results)
     
-    def test_check_word_level(self):
+    @pytest.mark.parametrize("word, target_level, expected", [
+        # Words at or below target level
+        ('cat', 'A1', True),
+        ('cat', 'A2', True),
+        ('cat', 'C2', True),
+        ('beautiful', 'B1', True),
+        ('beautiful', 'B2', True),
+        ('beautiful', 'A2', False),
+        # Word above target level
+        ('paradigm', 'B1', False),
+        ('paradigm', 'C1', True),
+        ('paradigm', 'C2', True),
+        # Non-existent word
+        ('xyz123', 'C2', False),
+        # Invalid target level
+        ('cat', 'X1', False),
+    ])
+    def test_check_word_level(self, monkeypatch, word, target_level, expected):
         """Test check_word_level function."""
-        with patch('pycefrizer.word_lookup.get_word_level') as mock_get_level:
-            mock_get_level.side_effect = lambda w: {
-                'cat': 'A1',
-                'beautiful': 'B1',
-                'paradigm': 'C1',
-                'xyz123': ''
-            }.get(w, '')
-            
-            # Test words at or below target level
-            assert check_word_level('cat', 'A1') == True
-            assert check_word_level('cat', 'A2') == True
-            assert check_word_level('cat', 'C2') == True
-            
-            assert check_word_level('beautiful', 'B1') == True
-            assert check_word_level('beautiful', 'B2') == True
-            assert check_word_level('beautiful', 'A2') == False
-            
-            # Test word above target level
-            assert check_word_level('paradigm', 'B1') == False
-            assert check_word_level('paradigm', 'C1') == True
-            assert check_word_level('paradigm', 'C2') == True
-            
-            # Test non-existent word
-            assert check_word_level('xyz123', 'C2') == False
-            
-            # Test invalid target level
-            assert check_word_level('cat', 'X1') == False
\ No newline at end of file
+        monkeypatch.setattr(
+            'pycefrizer.word_lookup.get_word_level', lambda w: WORD_LEVELS.get(w) or ''
+        )
+        assert check_word_level(word, target_level) is expected